@@ -7,10 +7,16 @@ a modern, flexible web interface with PIN-based authentication and database encr
 """
 
 from flask import Flask, render_template, jsonify, request, session, redirect, url_for
+from jinja2 import FileSystemBytecodeCache
 import sys
 import os
+import heapq
+import logging
+import threading
+import time
 import traceback
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -20,21 +26,38 @@ try:
     from utils.logging_config import get_logger
     from database.database import init_database, db_manager
     from services.data_service import DataService
-    from api.ecb_client import ECBClient
-    from auth.auth_service import AuthService
+    from api.ecb_client import get_ecb_client
+    from auth.auth_service import get_auth_service
     from auth.crypto_service import DatabaseCryptoService
     from auth.middleware import require_authentication, inject_auth_service, get_current_session_token, clear_session
-    import plotly
-    import plotly.utils
     import json
 except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure all dependencies are installed and src/ directory is accessible")
     sys.exit(1)
 
+# orjson is optional - fall back to the stdlib encoder when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# flask-compress is optional - responses are sent uncompressed without it
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
 # Initialize Flask app
 app = Flask(__name__)
 
+# Cache compiled templates on disk so fresh processes skip Jinja compilation
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+# Negotiate brotli/gzip compression for large JSON chart payloads
+if Compress is not None:
+    Compress(app)
+
 # Load configuration
 config = get_config()
 app.config['SECRET_KEY'] = config["security"]["session_secret_key"]
@@ -42,66 +65,130 @@ app.config['SECRET_KEY'] = config["security"]["session_secret_key"]
 # Setup logging
 logger = get_logger(__name__)
 
-# Global services (initialized on first request)
+# Global services (initialized once per process, see initialize_services)
 data_service = None
 ecb_client = None
+chart_service = None
 auth_service = None
 crypto_service = None
 database_initialized = False
 
+# Guards the cold initialization path; once initialized, callers only check the flag
+_init_lock = threading.RLock()
+
+# Cached timestamp for responses that only need approximate time
+CLOCK_RESOLUTION_SECONDS = 0.25
+_now_iso = ''
+_now_iso_expires = 0.0
+
+# Serialized chart responses: series key -> (data version, JSON bytes)
+_chart_cache = {}
+
 def plotly_to_json(fig):
     """Convert Plotly figure to JSON safely"""
+    # Build the dict once; trace arrays are passed through untouched
+    # and dumps_json() serializes lists and numpy arrays alike
+    chart_dict = fig.to_dict()
+    
     try:
-        # Use fig.to_dict() directly to avoid serialization issues
-        chart_dict = fig.to_dict()
-        
-        # Ensure data arrays are properly formatted
-        if 'data' in chart_dict and len(chart_dict['data']) > 0:
-            for trace in chart_dict['data']:
-                # Convert any string arrays back to proper arrays
-                if 'x' in trace and isinstance(trace['x'], str):
-                    trace['x'] = trace['x'].split()
-                if 'y' in trace and isinstance(trace['y'], str):
-                    trace['y'] = [float(val) for val in trace['y'].split()]
-                
-                # Ensure numeric arrays are lists, not numpy arrays
-                if 'x' in trace and hasattr(trace['x'], 'tolist'):
-                    trace['x'] = trace['x'].tolist()
-                if 'y' in trace and hasattr(trace['y'], 'tolist'):
-                    trace['y'] = trace['y'].tolist()
-        
-        # Debug logging for chart data
-        if 'data' in chart_dict and len(chart_dict['data']) > 0:
-            trace = chart_dict['data'][0]
-            if 'y' in trace:
-                y_values = trace['y']
-                logger.debug(f"Chart conversion - Y values count: {len(y_values)}")
-                logger.debug(f"Chart conversion - Y values type: {type(y_values)}")
-                if isinstance(y_values, list) and len(y_values) > 0:
-                    logger.debug(f"Chart conversion - First 3 Y values: {y_values[:3]}")
-                    logger.debug(f"Chart conversion - Last 3 Y values: {y_values[-3:]}")
-                    logger.debug(f"Chart conversion - Min Y: {min(y_values)}, Max Y: {max(y_values)}")
-        
-        return chart_dict
+        # Debug logging for chart data, using the raw y-value array attached by ChartService
+        if logger.isEnabledFor(logging.DEBUG):
+            y_values = getattr(fig, '_y_array', None)
+            if y_values is not None and y_values.size > 0:
+                logger.debug("Chart conversion - Y values count: %d", y_values.size)
+                logger.debug("Chart conversion - Y values type: %s", type(y_values))
+                logger.debug("Chart conversion - First 3 Y values: %s", y_values[:3])
+                logger.debug("Chart conversion - Last 3 Y values: %s", y_values[-3:])
+                logger.debug("Chart conversion - Min Y: %s, Max Y: %s", y_values.min(), y_values.max())
     except Exception as e:
-        logger.error(f"Chart conversion failed: {e}")
-        # Fallback to basic dict conversion
-        return fig.to_dict()
+        logger.error(f"Chart debug logging failed: {e}")
+    
+    return chart_dict
+
+def dumps_json(payload):
+    """Serialize payload to JSON bytes, bypassing Flask's stdlib encoder"""
+    if orjson is not None:
+        # orjson serializes numpy arrays natively, so chart data needs no tolist() pass
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    from plotly.utils import PlotlyJSONEncoder
+    return json.dumps(payload, cls=PlotlyJSONEncoder).encode('utf-8')
+
+def _chart_response(body, version, data, status=200):
+    """Build a chart API response from already-serialized JSON bytes"""
+    response = app.response_class(body, status=status, mimetype='application/json')
+    # Chart data is per-user and can be refreshed in-page, so browsers must revalidate
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.set_etag(version)
+    if data.metadata.last_updated:
+        response.last_modified = data.metadata.last_updated.astimezone(timezone.utc)
+    return response
+
+def _data_version(data):
+    """Version tag for series data, changes whenever the series is refreshed"""
+    last_updated = data.metadata.last_updated.timestamp() if data.metadata.last_updated else 0
+    return f"{last_updated:.6f}-{len(data.observations)}"
+
+def _client_has_version(version):
+    """Check whether the request's If-None-Match already names this data version"""
+    # flask-compress appends ':<encoding>' to the ETags it sends out
+    return any(etag.split(':', 1)[0] == version for etag in request.if_none_match)
+
+def get_cached_chart_response(series_key, data):
+    """Return a 304 or the cached chart response for a series if its data has not changed"""
+    version = _data_version(data)
+    
+    # The client already holds this version: nothing to serialize or send
+    if _client_has_version(version):
+        return _chart_response(b'', version, data, status=304)
+    
+    cached = _chart_cache.get(series_key)
+    if cached and cached[0] == version:
+        return _chart_response(cached[1], version, data)
+    return None
+
+def cache_chart_response(series_key, data, payload):
+    """Serialize a chart payload and keep the bytes for subsequent requests"""
+    version = _data_version(data)
+    body = dumps_json(payload)
+    _chart_cache[series_key] = (version, body)
+    return _chart_response(body, version, data)
+
+def clear_chart_cache():
+    """Drop all cached chart responses (called after data refreshes)"""
+    _chart_cache.clear()
+
+def cached_now_iso():
+    """Current time as an ISO string, reformatted at most every CLOCK_RESOLUTION_SECONDS"""
+    global _now_iso, _now_iso_expires
+    
+    now = time.monotonic()
+    if now >= _now_iso_expires:
+        _now_iso = datetime.now().isoformat()
+        _now_iso_expires = now + CLOCK_RESOLUTION_SECONDS
+    return _now_iso
 
 def initialize_services():
     """Initialize services once"""
-    global data_service, ecb_client, auth_service, crypto_service, database_initialized
+    global auth_service, crypto_service
+    
+    # Fast path: nothing to do once the database and services are up
+    if database_initialized:
+        return True
     
-    if not database_initialized:
+    with _init_lock:
+        if database_initialized:
+            return True
+        
         try:
-            logger.info("Initializing ECB services with security...")
-            
-            # Initialize authentication and encryption services
-            auth_service = AuthService()
-            crypto_service = DatabaseCryptoService()
-            
-            # Inject auth service into middleware
-            inject_auth_service(auth_service)
+            if auth_service is None:
+                logger.info("Initializing ECB services with security...")
+                
+                # Initialize authentication and encryption services
+                auth_service = get_auth_service()
+                crypto_service = DatabaseCryptoService()
+                
+                # Inject auth service into middleware
+                inject_auth_service(auth_service)
             
             # Check if database needs to be decrypted
             if crypto_service.is_database_encrypted():
@@ -115,31 +202,41 @@ def initialize_services():
         except Exception as e:
             logger.error(f"Service initialization failed: {e}")
             return False
-    
-    return True
+
+def services_ready():
+    """Check the data services are up, retrying initialization if it failed at import"""
+    return database_initialized or (initialize_services() and database_initialized)
 
 def initialize_database_and_services():
     """Initialize database and business services after authentication"""
-    global data_service, ecb_client, database_initialized
+    global data_service, ecb_client, chart_service, database_initialized
     
-    try:
-        # Initialize database
-        init_success = init_database()
-        if not init_success:
-            logger.error("Database initialization failed!")
-            return False
-        
-        # Initialize business services
-        data_service = DataService()
-        ecb_client = ECBClient()
-        
-        database_initialized = True
-        logger.info("Database and services initialized successfully")
-        return True
+    with _init_lock:
+        if database_initialized:
+            return True
         
-    except Exception as e:
-        logger.error(f"Database and services initialization failed: {e}")
-        return False
+        try:
+            # Initialize database
+            init_success = init_database()
+            if not init_success:
+                logger.error("Database initialization failed!")
+                return False
+            
+            # Initialize business services
+            data_service = DataService()
+            ecb_client = get_ecb_client()
+            
+            # Plotly is heavy to import; only load it once the data services come up
+            from services.chart_service import ChartService
+            chart_service = ChartService()
+            
+            database_initialized = True
+            logger.info("Database and services initialized successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Database and services initialization failed: {e}")
+            return False
 
 # =============================================================================
 # AUTHENTICATION ROUTES
@@ -171,8 +268,16 @@ def auth_validate():
                 'error': 'Authentication service not available'
             }), 500
         
-        data = request.get_json()
-        pin = data.get('pin', '').strip()
+        data = request.get_json(silent=True)
+        pin = str(data.get('pin') or '').strip() if isinstance(data, dict) else ''
+        
+        # Reject malformed input before touching the rate limiter or PIN hash
+        if not pin or len(pin) > 32:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid PIN'
+            }), 400
+        
         client_ip = request.remote_addr or 'unknown'
         
         # Validate PIN
@@ -233,11 +338,7 @@ def auth_check_session():
             return jsonify({'valid': False}), 401
         
         # Get session token from request
-        auth_header = request.headers.get('Authorization')
-        if auth_header and auth_header.startswith('Bearer '):
-            session_token = auth_header[7:]
-        else:
-            session_token = session.get('session_token')
+        session_token = get_current_session_token()
         
         if not session_token:
             return jsonify({'valid': False}), 401
@@ -265,11 +366,7 @@ def auth_logout():
     try:
         if auth_service:
             # Get session token
-            auth_header = request.headers.get('Authorization')
-            if auth_header and auth_header.startswith('Bearer '):
-                session_token = auth_header[7:]
-            else:
-                session_token = session.get('session_token')
+            session_token = get_current_session_token()
             
             if session_token:
                 auth_service.destroy_session(session_token)
@@ -299,80 +396,41 @@ def auth_logout():
 # PROTECTED APPLICATION ROUTES
 # =============================================================================
 
-@app.route('/')
-@require_authentication
-def dashboard():
-    """Main dashboard page"""
+def render_page(template, page_name):
+    """Render a protected application page"""
     try:
-        # Ensure services are initialized
-        if not initialize_services():
+        if not services_ready():
             return render_template('error.html', 
                                  error="Service initialization failed"), 500
         
-        return render_template('dashboard.html')
+        return render_template(template)
     
     except Exception as e:
-        logger.error(f"Dashboard error: {e}")
+        logger.error(f"{page_name} error: {e}")
         return render_template('error.html', 
-                             error=f"Dashboard error: {str(e)}"), 500
-
-@app.route('/exchange-rates')
-@require_authentication
-def exchange_rates_page():
-    """Dedicated EUR/USD exchange rates page"""
-    try:
-        # Ensure services are initialized
-        if not initialize_services():
-            return render_template('error.html', 
-                                 error="Service initialization failed"), 500
-        
-        return render_template('exchange_rates.html')
-    
-    except Exception as e:
-        logger.error(f"Exchange rates page error: {e}")
-        return render_template('error.html', 
-                             error=f"Exchange rates page error: {str(e)}"), 500
-
-@app.route('/inflation')
-@require_authentication
-def inflation_page():
-    """Dedicated HICP inflation page"""
-    try:
-        # Ensure services are initialized
-        if not initialize_services():
-            return render_template('error.html', 
-                                 error="Service initialization failed"), 500
-        
-        return render_template('inflation.html')
-    
-    except Exception as e:
-        logger.error(f"Inflation page error: {e}")
-        return render_template('error.html', 
-                             error=f"Inflation page error: {str(e)}"), 500
-
-@app.route('/interest-rates')
-@require_authentication
-def interest_rates_page():
-    """Dedicated ECB interest rates page"""
-    try:
-        # Ensure services are initialized
-        if not initialize_services():
-            return render_template('error.html', 
-                                 error="Service initialization failed"), 500
-        
-        return render_template('interest_rates.html')
-    
-    except Exception as e:
-        logger.error(f"Interest rates page error: {e}")
-        return render_template('error.html', 
-                             error=f"Interest rates page error: {str(e)}"), 500
+                             error=f"{page_name} error: {str(e)}"), 500
+
+# Application pages: (URL rule, endpoint, template, name used in error messages)
+APPLICATION_PAGES = [
+    ('/', 'dashboard', 'dashboard.html', 'Dashboard'),                                        # Main dashboard page
+    ('/exchange-rates', 'exchange_rates_page', 'exchange_rates.html', 'Exchange rates page'), # EUR/USD exchange rates
+    ('/inflation', 'inflation_page', 'inflation.html', 'Inflation page'),                     # HICP inflation
+    ('/interest-rates', 'interest_rates_page', 'interest_rates.html', 'Interest rates page')  # ECB interest rates
+]
+
+for rule, endpoint, template, page_name in APPLICATION_PAGES:
+    app.add_url_rule(
+        rule,
+        endpoint=endpoint,
+        view_func=require_authentication(partial(render_page, template, page_name))
+    )
 
 @app.route('/api/test')
 @require_authentication
 def api_test():
     """Test API endpoint to verify services"""
     try:
-        if not initialize_services():
+        if not services_ready():
             return jsonify({'error': 'Services not initialized'}), 500
         
         # Test ECB client connection
@@ -387,7 +445,7 @@ def api_test():
                 'database': True,  # If we got here, DB is working
                 'api_connection': connection_ok
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': cached_now_iso()
         })
     
     except Exception as e:
@@ -395,7 +453,7 @@ def api_test():
         return jsonify({
             'status': 'error',
             'message': str(e),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': cached_now_iso()
         }), 500
 
 @app.route('/api/exchange-rates')
@@ -403,16 +461,17 @@ def api_test():
 def api_exchange_rates():
     """Get exchange rate chart data"""
     try:
-        if not initialize_services():
+        if not services_ready():
             return jsonify({'error': 'Services not initialized'}), 500
         
         logger.info("Fetching exchange rate data for API")
         data = data_service.get_exchange_rate_data()
         
         if data and data.observations:
-            # Import chart service here to avoid circular imports
-            from services.chart_service import ChartService
-            chart_service = ChartService()
+            # Reuse the serialized chart while the series is unchanged
+            cached_response = get_cached_chart_response('exchange-rates', data)
+            if cached_response:
+                return cached_response
             
             # Generate chart
             fig = chart_service.create_exchange_rate_chart(data)
@@ -420,7 +479,7 @@ def api_exchange_rates():
             # Convert to JSON format for frontend
             chart_json = plotly_to_json(fig)
             
-            return jsonify({
+            return cache_chart_response('exchange-rates', data, {
                 'success': True,
                 'chart': chart_json,
                 'latest_rate': data.latest_value,
@@ -448,16 +507,17 @@ def api_exchange_rates():
 def api_inflation():
     """Get inflation chart data"""
     try:
-        if not initialize_services():
+        if not services_ready():
             return jsonify({'error': 'Services not initialized'}), 500
         
         logger.info("Fetching inflation data for API")
         data = data_service.get_inflation_data()
         
         if data and data.observations:
-            # Import chart service here to avoid circular imports
-            from services.chart_service import ChartService
-            chart_service = ChartService()
+            # Reuse the serialized chart while the series is unchanged
+            cached_response = get_cached_chart_response('inflation', data)
+            if cached_response:
+                return cached_response
             
             # Generate chart
             fig = chart_service.create_inflation_chart(data)
@@ -465,7 +525,7 @@ def api_inflation():
             # Convert to JSON format for frontend
             chart_json = plotly_to_json(fig)
             
-            return jsonify({
+            return cache_chart_response('inflation', data, {
                 'success': True,
                 'chart': chart_json,
                 'latest_rate': data.latest_value,
@@ -494,11 +554,12 @@ def api_inflation():
 def api_refresh_data():
     """Refresh all data from ECB API"""
     try:
-        if not initialize_services():
+        if not services_ready():
             return jsonify({'error': 'Services not initialized'}), 500
         
         logger.info("Refreshing all data from ECB API")
         result = data_service.refresh_all_data(force=True)
+        clear_chart_cache()
         
         return jsonify({
             'success': True,
@@ -520,7 +581,7 @@ def api_refresh_data():
 def api_interest_rates():
     """Get interest rate chart data"""
     try:
-        if not initialize_services():
+        if not services_ready():
             return jsonify({'error': 'Services not initialized'}), 500
         
         logger.info("Fetching interest rate data for API")
@@ -528,18 +589,20 @@ def api_interest_rates():
         
         if data and data.observations:
             # Debug: Log actual data values
-            logger.info(f"Interest rate data - Observations: {len(data.observations)}")
-            logger.info(f"Interest rate data - Latest value: {data.latest_value}")
-            logger.info(f"Interest rate data - Series title: {data.metadata.title if data.metadata else 'N/A'}")
+            logger.info("Interest rate data - Observations: %d", len(data.observations))
+            logger.info("Interest rate data - Latest value: %s", data.latest_value)
+            logger.info("Interest rate data - Series title: %s", data.metadata.title if data.metadata else 'N/A')
             
-            # Log recent values for debugging
-            recent_values = sorted(data.observations, key=lambda x: x.period)[-5:]
-            for obs in recent_values:
-                    logger.debug(f"Interest rate observation: {obs.period} = {obs.value}%")
+            # Log recent values for debugging (skips the sort entirely unless DEBUG is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                recent_values = heapq.nlargest(5, data.observations, key=lambda x: x.period)
+                for obs in reversed(recent_values):
+                    logger.debug("Interest rate observation: %s = %s%%", obs.period, obs.value)
             
-            # Import chart service here to avoid circular imports
-            from services.chart_service import ChartService
-            chart_service = ChartService()
+            # Reuse the serialized chart while the series is unchanged
+            cached_response = get_cached_chart_response('interest-rates', data)
+            if cached_response:
+                return cached_response
             
             # Generate chart
             fig = chart_service.create_interest_rate_chart(data)
@@ -547,7 +610,7 @@ def api_interest_rates():
             # Convert to JSON format for frontend
             chart_json = plotly_to_json(fig)
             
-            return jsonify({
+            return cache_chart_response('interest-rates', data, {
                 'success': True,
                 'chart': chart_json,
                 'latest_rate': data.latest_value,
@@ -575,17 +638,17 @@ def api_interest_rates():
 def refresh_data(data_type):
     """Refresh specific data type"""
     try:
-        if not initialize_services():
+        if not services_ready():
             return jsonify({'error': 'Services not initialized'}), 500
         
         logger.info(f"Refreshing data for: {data_type}")
         
         if data_type == 'exchange-rates':
-            result = ecb_client.fetch_exchange_rates()
+            result = ecb_client.fetch_exchange_rates(use_cache=False)
         elif data_type == 'inflation':
-            result = ecb_client.fetch_inflation_data()
+            result = ecb_client.fetch_inflation_data(use_cache=False)
         elif data_type == 'interest-rates':
-            result = ecb_client.fetch_interest_rates()
+            result = ecb_client.fetch_interest_rates(use_cache=False)
         else:
             return jsonify({
                 'success': False,
@@ -597,6 +660,7 @@ def refresh_data(data_type):
             # Store the data if fetch was successful
             if result.data:
                 data_service._store_series_data(result.data)
+                clear_chart_cache()
             
             return jsonify({
                 'success': True,
@@ -623,13 +687,14 @@ def refresh_data(data_type):
 def refresh_all_data():
     """Refresh all data types"""
     try:
-        if not initialize_services():
+        if not services_ready():
             return jsonify({'error': 'Services not initialized'}), 500
         
         logger.info("Refreshing all data")
         
         # Use the existing refresh_all_data method
         refresh_result = data_service.refresh_all_data(force=True)
+        clear_chart_cache()
         
         return jsonify({
             'success': refresh_result.successful > 0,
@@ -663,7 +728,7 @@ def health_check():
         'status': 'healthy',
         'application': 'ECB Financial Data Visualizer',
         'version': '2.0.0-flask',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': cached_now_iso()
     })
 
 @app.errorhandler(404)
@@ -679,6 +744,10 @@ def internal_error(error):
     return render_template('error.html', 
                          error="Internal server error"), 500
 
+# Initialize services once per process; WSGI servers import this module in each worker.
+# Handlers still call services_ready(), which is a flag check once this has succeeded
+initialize_services()
+
 if __name__ == '__main__':
     print("🏛️  ECB Financial Data Visualizer - Flask Edition")
     print("🚀 Starting application...")
@@ -692,13 +761,24 @@ if __name__ == '__main__':
         print("🔧 API test at: http://localhost:5000/api/test")
         print("=" * 50)
         
-        # Run Flask development server
-        app.run(
-            debug=True,
-            host='0.0.0.0',
-            port=5000,
-            use_reloader=False  # Prevent double initialization
-        )
+        if os.environ.get('ECB_DEV'):
+            # Run Flask development server
+            app.run(
+                debug=True,
+                host='0.0.0.0',
+                port=5000,
+                use_reloader=False  # Prevent double initialization
+            )
+        else:
+            # Serve with a multi-threaded production WSGI server
+            # (on Linux, `gunicorn -w 1 -k gthread --threads 8 app:app` works as well)
+            try:
+                from waitress import serve
+            except ImportError:
+                print("⚠️  waitress not installed - falling back to threaded Flask server")
+                app.run(host='0.0.0.0', port=5000, threaded=True, use_reloader=False)
+            else:
+                serve(app, host='0.0.0.0', port=5000, threads=8)
     else:
         print("❌ Service initialization failed")
         print("🔍 Check logs for details")
@@ -16,27 +16,69 @@ Usage:
 
 import os
 import sys
+import gzip
 import json
 import argparse
 import requests
+import threading
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from pathlib import Path
 from typing import Dict, List, Optional
-import time
 
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from utils.config import ECB_SERIES_CONFIG, ECB_API_CONFIG
+from utils.helpers import TokenBucket
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Upper bound on simultaneous requests to the ECB API
+MAX_CONCURRENT_DOWNLOADS = 5
+
+# Series downloaded by default - everything except the test configurations
+PRODUCTION_SERIES = MappingProxyType({
+    name: config for name, config in ECB_SERIES_CONFIG.items()
+    if not name.startswith('EUR_USD_TEST')
+})
+
+def dump_json(data: Dict) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a temp file beside path, fsync it, then rename it into place"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 class ECBDataDownloader:
     """Downloads ECB financial data and saves it locally"""
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, compress: bool = False):
         self.base_url = ECB_API_CONFIG["base_url"]
         self.timeout = ECB_API_CONFIG["timeout"]
         self.output_dir = Path(output_dir) if output_dir else Path(__file__).parent.parent / "data" / "raw-data"
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.compress = compress
+        self._print_lock = threading.Lock()
         
         # Create session with reasonable defaults
         self.session = requests.Session()
@@ -46,8 +88,32 @@ class ECBDataDownloader:
             'Accept-Encoding': 'gzip, deflate'
         })
         
+        # Concurrent downloads share one bucket so together they stay within the configured rate
+        self._rate_limiter = TokenBucket(ECB_API_CONFIG["rate_limit_per_minute"])
+        
+        # Keep-alive pool sized for the concurrent downloads, with retries on transient errors;
+        # max_retries counts total attempts, as in ECBClient
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_DOWNLOADS,
+            pool_maxsize=MAX_CONCURRENT_DOWNLOADS,
+            max_retries=Retry(
+                total=max(ECB_API_CONFIG["max_retries"] - 1, 0),
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         print(f"📁 Output directory: {self.output_dir}")
         print(f"🌐 ECB API base URL: {self.base_url}")
+        
+        # Resolve every configured series URL once up front
+        self._series_urls = {
+            name: self.build_api_url(config) for name, config in ECB_SERIES_CONFIG.items()
+        }
     
     def build_api_url(self, series_config: Dict[str, str]) -> str:
         """Build the complete API URL for a series"""
@@ -55,17 +121,62 @@ class ECBDataDownloader:
         key = series_config["key"]
         return f"{self.base_url}/data/{resource}/{key}"
     
+    def series_file(self, series_name: str) -> Path:
+        """Path of the saved XML for a series (.xml.gz when compressing)"""
+        suffix = ".xml.gz" if self.compress else ".xml"
+        return self.output_dir / f"{series_name}{suffix}"
+    
+    def build_conditional_headers(self, series_name: str, url: str, params: Dict[str, str]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the previous download's metadata"""
+        filepath = self.series_file(series_name)
+        metadata_file = self.output_dir / f"{series_name}_metadata.json"
+        if not filepath.exists() or not metadata_file.exists():
+            return {}
+        
+        try:
+            with open(metadata_file, 'r') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        # A different URL or date range means the saved file doesn't answer this request
+        if metadata.get('api_url') != url or metadata.get('parameters') != params:
+            return {}
+        
+        previous_headers = CaseInsensitiveDict(metadata.get('response_headers') or {})
+        headers = {}
+        if previous_headers.get('etag'):
+            headers['If-None-Match'] = previous_headers['etag']
+        if previous_headers.get('last-modified'):
+            headers['If-Modified-Since'] = previous_headers['last-modified']
+        return headers
+    
     def download_series(self, series_name: str, series_config: Dict[str, str], 
                        start_date: Optional[str] = None, end_date: Optional[str] = None) -> bool:
         """Download a single series and save it locally"""
         
-        print(f"\n📊 Downloading {series_name}...")
-        print(f"   Resource: {series_config['resource']}")
-        print(f"   Key: {series_config['key']}")
+        # Buffer output so concurrent downloads don't interleave their lines
+        lines = []
+        log = lines.append
         
+        log(f"\n📊 Downloading {series_name}...")
+        log(f"   Resource: {series_config['resource']}")
+        log(f"   Key: {series_config['key']}")
+        
+        try:
+            return self._download_series(series_name, series_config, start_date, end_date, log)
+        finally:
+            with self._print_lock:
+                print("\n".join(lines))
+    
+    def _download_series(self, series_name: str, series_config: Dict[str, str],
+                         start_date: Optional[str], end_date: Optional[str], log) -> bool:
+        """Fetch and save a single series, reporting progress through log"""
         try:
             # Build URL and parameters
-            url = self.build_api_url(series_config)
+            url = self._series_urls.get(series_name)
+            if url is None or series_config is not ECB_SERIES_CONFIG.get(series_name):
+                url = self.build_api_url(series_config)
             params = {}
             
             # Add date range if specified
@@ -75,58 +186,90 @@ class ECBDataDownloader:
                 params['endPeriod'] = end_date
             
             # Make the request
-            print(f"   🔗 URL: {url}")
+            log(f"   🔗 URL: {url}")
             if params:
-                print(f"   📅 Parameters: {params}")
-            
-            response = self.session.get(url, params=params, timeout=self.timeout)
+                log(f"   📅 Parameters: {params}")
             
-            print(f"   📡 Status: {response.status_code} {response.reason}")
-            print(f"   📏 Content Length: {len(response.content)} bytes")
-            print(f"   📋 Content Type: {response.headers.get('content-type', 'unknown')}")
-            
-            if response.status_code == 200:
-                # Save the raw XML response
-                filename = f"{series_name}.xml"
-                filepath = self.output_dir / filename
-                
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-                
-                print(f"   ✅ Saved to: {filepath}")
+            # Stream the body so large series go straight to disk
+            headers = self.build_conditional_headers(series_name, url, params)
+            self._rate_limiter.acquire()
+            with self.session.get(url, params=params, headers=headers, timeout=self.timeout, stream=True) as response:
                 
-                # Save metadata
-                metadata = {
-                    'series_name': series_name,
-                    'resource': series_config['resource'],
-                    'key': series_config['key'],
-                    'download_timestamp': datetime.now().isoformat(),
-                    'api_url': url,
-                    'parameters': params,
-                    'status_code': response.status_code,
-                    'content_length': len(response.content),
-                    'content_type': response.headers.get('content-type'),
-                    'response_headers': dict(response.headers)
-                }
+                log(f"   📡 Status: {response.status_code} {response.reason}")
                 
-                metadata_file = self.output_dir / f"{series_name}_metadata.json"
-                with open(metadata_file, 'w') as f:
-                    json.dump(metadata, f, indent=2)
+                if response.status_code == 304:
+                    log(f"   ♻️  Unchanged since last download, keeping: {self.series_file(series_name)}")
+                    return True
                 
-                print(f"   📝 Metadata saved to: {metadata_file}")
-                return True
+                log(f"   📋 Content Type: {response.headers.get('content-type', 'unknown')}")
                 
-            else:
-                print(f"   ❌ Failed: {response.status_code} {response.reason}")
-                if response.text:
-                    print(f"   📄 Error response: {response.text[:200]}...")
-                return False
+                if response.status_code == 200:
+                    # Save the raw XML response
+                    filepath = self.series_file(series_name)
+                    content_length = 0
+                    
+                    # Stream into a temp file and rename, so an interrupted download never
+                    # leaves a truncated XML behind for the local loader
+                    tmp_path = filepath.with_name(filepath.name + '.tmp')
+                    try:
+                        with open(tmp_path, 'wb', buffering=1 << 20) as raw:
+                            if self.compress:
+                                f = gzip.GzipFile(filename=filepath.name, mode='wb', compresslevel=6, fileobj=raw)
+                            else:
+                                f = raw
+                            for chunk in response.iter_content(chunk_size=64 * 1024):
+                                f.write(chunk)
+                                content_length += len(chunk)
+                            if f is not raw:
+                                f.close()
+                            raw.flush()
+                            os.fsync(raw.fileno())
+                        os.replace(tmp_path, filepath)
+                    except BaseException:
+                        tmp_path.unlink(missing_ok=True)
+                        raise
+                    
+                    # Remove the other variant so the client can't load a stale copy
+                    other_suffix = ".xml" if self.compress else ".xml.gz"
+                    (self.output_dir / f"{series_name}{other_suffix}").unlink(missing_ok=True)
+                    
+                    log(f"   📏 Content Length: {content_length} bytes")
+                    if self.compress:
+                        log(f"   🗜️  Compressed Size: {filepath.stat().st_size} bytes")
+                    log(f"   ✅ Saved to: {filepath}")
+                    
+                    # Save metadata
+                    metadata = {
+                        'series_name': series_name,
+                        'resource': series_config['resource'],
+                        'key': series_config['key'],
+                        'download_timestamp': datetime.now().isoformat(),
+                        'api_url': url,
+                        'parameters': params,
+                        'status_code': response.status_code,
+                        'content_length': content_length,
+                        'content_type': response.headers.get('content-type'),
+                        'response_headers': dict(response.headers)
+                    }
+                    
+                    metadata_file = self.output_dir / f"{series_name}_metadata.json"
+                    # Serialize first so the file gets a single write instead of one per token
+                    atomic_write_bytes(metadata_file, dump_json(metadata))
+                    
+                    log(f"   📝 Metadata saved to: {metadata_file}")
+                    return True
+                    
+                else:
+                    log(f"   ❌ Failed: {response.status_code} {response.reason}")
+                    if response.text:
+                        log(f"   📄 Error response: {response.text[:200]}...")
+                    return False
                 
         except requests.exceptions.RequestException as e:
-            print(f"   ❌ Request failed: {e}")
+            log(f"   ❌ Request failed: {e}")
             return False
         except Exception as e:
-            print(f"   ❌ Unexpected error: {e}")
+            log(f"   ❌ Unexpected error: {e}")
             return False
     
     def download_all_series(self, indicators: Optional[List[str]] = None,
@@ -135,31 +278,30 @@ class ECBDataDownloader:
         
         # Filter indicators if specified
         if indicators:
-            series_to_download = {k: v for k, v in ECB_SERIES_CONFIG.items() if k in indicators}
+            requested = frozenset(indicators)
+            unknown = requested - ECB_SERIES_CONFIG.keys()
+            if unknown:
+                print(f"⚠️  Unknown indicators ignored: {', '.join(sorted(unknown))}")
+            
+            series_to_download = {k: v for k, v in ECB_SERIES_CONFIG.items() if k in requested}
             if not series_to_download:
                 print(f"❌ No matching indicators found for: {indicators}")
                 return
         else:
-            # Skip test configurations for full download
-            series_to_download = {k: v for k, v in ECB_SERIES_CONFIG.items() 
-                                if not k.startswith('EUR_USD_TEST')}
+            series_to_download = PRODUCTION_SERIES
         
         print(f"🚀 Starting download of {len(series_to_download)} indicators...")
         print(f"📅 Date range: {start_date or 'default'} to {end_date or 'default'}")
         
-        successful_downloads = 0
-        failed_downloads = 0
+        # Download concurrently; the bounded pool keeps us polite to the ECB API
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as executor:
+            results = list(executor.map(
+                lambda item: self.download_series(item[0], item[1], start_date, end_date),
+                series_to_download.items()
+            ))
         
-        for series_name, series_config in series_to_download.items():
-            success = self.download_series(series_name, series_config, start_date, end_date)
-            
-            if success:
-                successful_downloads += 1
-            else:
-                failed_downloads += 1
-            
-            # Rate limiting - be nice to the ECB API
-            time.sleep(1)
+        successful_downloads = sum(results)
+        failed_downloads = len(results) - successful_downloads
         
         print(f"\n📈 Download Summary:")
         print(f"   ✅ Successful: {successful_downloads}")
@@ -180,8 +322,7 @@ class ECBDataDownloader:
         }
         
         summary_file = self.output_dir / f"download_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+        atomic_write_bytes(summary_file, dump_json(summary))
         
         print(f"   📋 Summary saved to: {summary_file}")
 
@@ -225,6 +366,12 @@ Examples:
         default=None
     )
     
+    parser.add_argument(
+        '--compress',
+        help='Store the XML files gzip-compressed (.xml.gz)',
+        action='store_true'
+    )
+    
     parser.add_argument(
         '--list-indicators',
         help='List all available indicators and exit',
@@ -276,7 +423,7 @@ Examples:
         print(f"📅 Using default date range: {start_date} to {end_date}")
     
     # Create downloader and start download
-    downloader = ECBDataDownloader(output_dir=args.output_dir)
+    downloader = ECBDataDownloader(output_dir=args.output_dir, compress=args.compress)
     downloader.download_all_series(indicators=indicators, start_date=start_date, end_date=end_date)
 
 if __name__ == "__main__":
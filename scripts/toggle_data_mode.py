@@ -11,6 +11,8 @@ Usage:
     python scripts/toggle_data_mode.py --status
 """
 
+import os
+import re
 import sys
 import argparse
 from pathlib import Path
@@ -20,6 +22,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from utils.config import get_config, ECB_API_CONFIG
 
+# Matches the use_local_data entry in config.py regardless of spacing
+USE_LOCAL_DATA_PATTERN = re.compile(r'("use_local_data"\s*:\s*)(True|False)')
+
 def update_config_file(use_local_data: bool):
     """Update the config file to set the data mode"""
     config_file = Path(__file__).parent.parent / "src" / "utils" / "config.py"
@@ -29,12 +34,11 @@ def update_config_file(use_local_data: bool):
         content = f.read()
     
     # Replace the use_local_data setting
-    old_line = f'"use_local_data": {not use_local_data},'
-    new_line = f'"use_local_data": {use_local_data},'
+    content, replacements = USE_LOCAL_DATA_PATTERN.subn(
+        lambda match: f"{match.group(1)}{use_local_data}", content, count=1
+    )
     
-    if old_line in content:
-        content = content.replace(old_line, new_line)
-        
+    if replacements:
         # Write the updated config
         with open(config_file, 'w') as f:
             f.write(content)
@@ -44,7 +48,7 @@ def update_config_file(use_local_data: bool):
         return True
     else:
         print(f"❌ Could not find the configuration line to update")
-        print(f"   Looking for: {old_line}")
+        print(f"   Looking for: {USE_LOCAL_DATA_PATTERN.pattern}")
         return False
 
 def show_status():
@@ -63,15 +67,24 @@ def show_status():
             print(f"   Local Data Directory: {data_dir}")
             
             if data_dir.exists():
-                xml_files = list(data_dir.glob("*.xml"))
-                metadata_files = list(data_dir.glob("*_metadata.json"))
-                print(f"   Available Data Files: {len(xml_files)} XML files, {len(metadata_files)} metadata files")
+                # One directory pass; DirEntry caches the stat data
+                xml_files = []
+                metadata_count = 0
+                with os.scandir(data_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
+                        if entry.name.endswith((".xml", ".xml.gz")):
+                            xml_files.append((entry.name, entry.stat().st_size))
+                        elif entry.name.endswith("_metadata.json"):
+                            metadata_count += 1
+                print(f"   Available Data Files: {len(xml_files)} XML files, {metadata_count} metadata files")
                 
                 if xml_files:
                     print("   📁 Data Files:")
-                    for xml_file in sorted(xml_files):
-                        file_size = xml_file.stat().st_size
-                        print(f"      - {xml_file.name} ({file_size:,} bytes)")
+                    xml_files.sort()
+                    for file_name, file_size in xml_files:
+                        print(f"      - {file_name} ({file_size:,} bytes)")
                 else:
                     print("   ⚠️  No data files found in local directory")
                     print("   💡 Run: python scripts/download_ecb_data.py")
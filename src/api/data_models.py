@@ -2,10 +2,15 @@
 Pydantic data models for ECB API responses and internal data structures
 """
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from functools import cached_property
+from operator import attrgetter
+from typing import List, NamedTuple, Optional, Dict, Any, ClassVar
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
+_period_key = attrgetter('period')
+
 class SeriesFrequency(str, Enum):
     """ECB data frequency types"""
     DAILY = "D"
@@ -25,16 +30,18 @@ class ObservationStatus(str, Enum):
 
 class ECBObservation(BaseModel):
     """Individual observation from ECB API"""
-    period: str = Field(..., description="Time period (YYYY-MM-DD, YYYY-MM, etc.)")
+    model_config = ConfigDict(frozen=True)
+    
+    # min_length is enforced by pydantic-core, so no Python-level validator runs per observation
+    period: str = Field(..., min_length=4, description="Time period (YYYY-MM-DD, YYYY-MM, etc.)")
     value: Optional[float] = Field(None, description="Observation value")
     status: Optional[ObservationStatus] = Field(None, description="Observation status")
     
-    @validator('period')
-    def validate_period(cls, v):
-        """Validate period format"""
-        if not v or len(v) < 4:
-            raise ValueError("Period must be at least 4 characters (YYYY)")
-        return v
+    @classmethod
+    def from_trusted(cls, period: str, value: Optional[float],
+                     status: Optional[ObservationStatus] = None) -> "ECBObservation":
+        """Build an observation from already-checked parser or database values, skipping validation"""
+        return cls.model_construct(period=period, value=value, status=status)
 
 class SeriesMetadata(BaseModel):
     """Metadata for a time series"""
@@ -50,14 +57,54 @@ class ECBSeriesData(BaseModel):
     metadata: SeriesMetadata
     observations: List[ECBObservation] = Field(default_factory=list)
     
+    @classmethod
+    def from_trusted(cls, metadata: SeriesMetadata, observations: List[ECBObservation]):
+        """Build series data from trusted observations without re-validating the list"""
+        return cls.model_construct(metadata=metadata, observations=observations)
+    
+    # sorted_observations and values_array are memoized; replace the observations list rather than
+    # mutating it in place, so assignment and model_copy(update=...) can drop the stale copies
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == 'observations':
+            self._drop_derived()
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        """Copy the model, dropping memoized views when the observations are replaced"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and 'observations' in update:
+            copied._drop_derived()
+        return copied
+    
+    def _drop_derived(self):
+        """Forget the memoized ordering and value array"""
+        self.__dict__.pop('sorted_observations', None)
+        self.__dict__.pop('values_array', None)
+    
+    @cached_property
+    def sorted_observations(self) -> List[ECBObservation]:
+        """Observations ordered by period, sorted once and reused"""
+        return sorted(self.observations, key=_period_key)
+    
+    @cached_property
+    def values_array(self) -> np.ndarray:
+        """Observation values in period order as float64, missing values as NaN"""
+        return np.fromiter(
+            (obs.value if obs.value is not None else np.nan for obs in self.sorted_observations),
+            dtype=np.float64,
+            count=len(self.sorted_observations)
+        )
+    
     @property
     def latest_value(self) -> Optional[float]:
         """Get the most recent observation value"""
+        # Reuse the sorted list if it exists, otherwise a single O(n) pass is enough
+        sorted_obs = self.__dict__.get('sorted_observations')
+        if sorted_obs is not None:
+            return sorted_obs[-1].value if sorted_obs else None
         if not self.observations:
             return None
-        # Sort by period and get the last value
-        sorted_obs = sorted(self.observations, key=lambda x: x.period)
-        return sorted_obs[-1].value if sorted_obs else None
+        return max(self.observations, key=_period_key).value
     
     @property
     def observation_count(self) -> int:
@@ -69,31 +116,31 @@ class ExchangeRateData(ECBSeriesData):
     
     def get_percentage_change(self, days: int = 1) -> Optional[float]:
         """Calculate percentage change over specified number of days"""
-        if len(self.observations) < days + 1:
-            return None
-            
-        sorted_obs = sorted(self.observations, key=lambda x: x.period)
-        if len(sorted_obs) < days + 1:
+        values = self.values_array
+        if len(values) < days + 1:
             return None
             
-        current = sorted_obs[-1].value
-        previous = sorted_obs[-(days + 1)].value
+        current = values[-1]
+        previous = values[-(days + 1)]
         
-        if current is None or previous is None or previous == 0:
+        if np.isnan(current) or np.isnan(previous) or previous == 0:
             return None
             
-        return ((current - previous) / previous) * 100
+        return float((current - previous) / previous * 100)
 
 class InflationData(ECBSeriesData):
     """Inflation rate specific data"""
     
+    # ECB medium-term inflation target, in percent
+    TARGET_RATE: ClassVar[float] = 2.0
+    
     @property
     def target_deviation(self) -> Optional[float]:
         """Calculate deviation from ECB's 2% target"""
         latest = self.latest_value
         if latest is None:
             return None
-        return latest - 2.0
+        return latest - self.TARGET_RATE
 
 class InterestRateData(ECBSeriesData):
     """Interest rate specific data"""
@@ -129,11 +176,44 @@ class RefreshResult(BaseModel):
 
 class ChartData(BaseModel):
     """Data structure for chart rendering"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     title: str
-    x_values: List[str] = Field(default_factory=list)
-    y_values: List[float] = Field(default_factory=list)
+    # Plain arrays so chart backends get contiguous data without per-element validation
+    x_values: np.ndarray = Field(default_factory=lambda: np.empty(0, dtype=np.str_))
+    y_values: np.ndarray = Field(default_factory=lambda: np.empty(0, dtype=np.float64))
     metadata: Dict[str, Any] = Field(default_factory=dict)
+
+class SeriesView(NamedTuple):
+    """Period-sorted series columns for rendering, one array per field"""
+    periods: np.ndarray
+    values: np.ndarray
+    statuses: np.ndarray
+    metadata: SeriesMetadata
+    
+    @classmethod
+    def from_series(cls, series: ECBSeriesData) -> "SeriesView":
+        """Build the column view from a series' period-sorted observations"""
+        ordered = series.sorted_observations
+        return cls(
+            periods=np.asarray([obs.period for obs in ordered], dtype=np.str_),
+            values=series.values_array,
+            statuses=np.asarray([obs.status.value if obs.status else "Normal" for obs in ordered], dtype=object),
+            metadata=series.metadata
+        )
+    
+    @property
+    def latest_value(self) -> Optional[float]:
+        """Get the most recent observation value"""
+        if not len(self.values) or np.isnan(self.values[-1]):
+            return None
+        return float(self.values[-1])
     
+    @property
+    def observation_count(self) -> int:
+        """Get total number of observations"""
+        return len(self.values)
+
 class DashboardData(BaseModel):
     """Complete dashboard data"""
     exchange_rates: Optional[ExchangeRateData] = None
@@ -144,8 +224,7 @@ class DashboardData(BaseModel):
     @property
     def has_data(self) -> bool:
         """Check if any data is available"""
-        return any([
-            self.exchange_rates and self.exchange_rates.observations,
-            self.inflation and self.inflation.observations,
-            self.interest_rates and self.interest_rates.observations
-        ])
+        for series in (self.exchange_rates, self.inflation, self.interest_rates):
+            if series is not None and series.observations:
+                return True
+        return False
@@ -2,17 +2,37 @@
 ECB API client for fetching financial data
 """
 import requests
+import threading
 import time
+import gzip
+import hashlib
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from urllib.parse import urljoin
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from utils.config import get_config
 from utils.logging_config import get_logger
-from utils.helpers import format_date_for_api, parse_ecb_date, get_default_date_range
+from utils.helpers import (
+    format_date_for_api, parse_ecb_date, get_default_date_range, save_json_cache, load_json_cache,
+    TokenBucket
+)
 from api.data_models import (
     ECBAPIResponse, ECBSeriesData, ECBObservation, SeriesMetadata, 
     ExchangeRateData, InflationData, InterestRateData, DataFetchResult,
@@ -21,6 +41,16 @@ from api.data_models import (
 
 logger = get_logger(__name__)
 
+# SDMX frequency codes map one-to-one onto SeriesFrequency values
+FREQUENCY_BY_CODE = {frequency.value: frequency for frequency in SeriesFrequency}
+
+# Series model by ECB dataflow (the resource prefix of the series key)
+SERIES_TYPE_BY_RESOURCE = {
+    "EXR": ExchangeRateData,
+    "ICP": InflationData,
+    "FM": InterestRateData
+}
+
 class ECBAPIException(Exception):
     """ECB API related exceptions"""
     pass
@@ -46,12 +76,31 @@ class ECBClient:
         self.series_config = self.config["series_config"]
         self.base_url = self.api_config["base_url"]
         self.session = requests.Session()
-        self.last_request_time = 0
+        
+        # Request settings read once instead of on every call
+        self.timeout = self.api_config["timeout"]
+        self.max_retries = int(self.api_config["max_retries"])
+        self.retry_delay = float(self.api_config["retry_delay"])
+        self.strict_parse = self.api_config.get("strict_parse", False)
+        
+        # Token bucket: allow a burst of up to rate_limit_per_minute requests, then throttle
+        self._rate_limiter = TokenBucket(self.api_config["rate_limit_per_minute"])
         
         # Local data configuration
         self.use_local_data = self.api_config.get("use_local_data", False)
         self.local_data_dir = Path(self.config["paths"]["project_root"]) / self.api_config.get("local_data_dir", "data/raw-data")
         
+        # On-disk cache of raw API responses
+        self.cache_dir = Path(self.config["paths"]["cache_dir"]) / "ecb_api"
+        self.cache_ttl = self.api_config.get("cache_ttl_seconds", 0)
+        # Starts in the past so the first cached write also sweeps out stale files
+        self._last_cache_prune = float("-inf")
+        
+        # In-process LRU of parsed series, so warm hits skip JSON and model construction
+        self._parsed_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._parsed_cache_lock = threading.Lock()
+        self._parsed_cache_size = 64
+        
         logger.info(f"ECB Client initialized - Use local data: {self.use_local_data}")
         if self.use_local_data:
             logger.info(f"Local data directory: {self.local_data_dir}")
@@ -59,25 +108,37 @@ class ECBClient:
         # Configure session
         self.session.headers.update({
             "User-Agent": "ECB-Financial-Visualizer/1.0",
-            "Accept": "application/json"
+            "Accept": "application/json",
+            # gzip/deflate, plus br when a brotli decoder is installed
+            "Accept-Encoding": ACCEPT_ENCODING
         })
+        
+        # Pooled keep-alive connections with urllib3-level retries and exponential backoff;
+        # max_retries counts total attempts, as the old request loop did. The pool holds more
+        # connections than fetch_all runs workers, so parallel series fetches never queue on one socket
+        retry = Retry(
+            total=max(self.max_retries - 1, 0),
+            backoff_factor=self.retry_delay,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def _rate_limit(self):
         """Implement rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        min_interval = 60 / self.api_config["rate_limit_per_minute"]
-        
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        sleep_time = self._rate_limiter.acquire()
+        if sleep_time:
+            logger.debug(f"Rate limiting: slept for {sleep_time:.2f} seconds")
     
     def _load_local_data(self, series_name: str) -> Dict[str, Any]:
         """Load data from local XML file"""
         xml_file = self.local_data_dir / f"{series_name}.xml"
+        compressed_file = self.local_data_dir / f"{series_name}.xml.gz"
+        if compressed_file.exists():
+            xml_file = compressed_file
         metadata_file = self.local_data_dir / f"{series_name}_metadata.json"
         
         if not xml_file.exists():
@@ -93,8 +154,10 @@ class ECBClient:
                     metadata = json.load(f)
                 logger.info(f"Loaded metadata: download timestamp {metadata.get('download_timestamp', 'unknown')}")
             
-            # Parse XML file
-            tree = ET.parse(xml_file)
+            # Parse XML file, decompressing on the fly for .xml.gz downloads
+            opener = gzip.open if xml_file.suffix == '.gz' else open
+            with opener(xml_file, 'rb') as f:
+                tree = ET.parse(f)
             root = tree.getroot()
             
             # Convert XML to a simplified JSON-like structure for compatibility
@@ -111,8 +174,9 @@ class ECBClient:
     def _convert_xml_to_json(self, xml_root, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Convert ECB XML response to JSON-like structure for compatibility with existing parsing"""
         try:
-            # Extract series data from ECB SDMX XML
-            observations = []
+            # Extract series data from ECB SDMX XML, keeping the raw value strings
+            periods = []
+            raw_values = []
             
             # Define XML namespaces used by ECB
             namespaces = {
@@ -137,26 +201,19 @@ class ECBClient:
                     obs_value = obs_val.get('value')
                 
                 if obs_time and obs_value:
-                    try:
-                        observations.append({
-                            'time_period': obs_time,
-                            'value': float(obs_value)
-                        })
-                    except (ValueError, TypeError):
-                        logger.warning(f"Could not convert value to float: {obs_value}")
-                        observations.append({
-                            'time_period': obs_time,
-                            'value': None
-                        })
-            
-            logger.info(f"Extracted {len(observations)} observations from ECB XML")
+                    periods.append(obs_time)
+                    raw_values.append(obs_value)
+            
+            logger.info(f"Extracted {len(periods)} observations from ECB XML")
             
             # If no observations found, try fallback parsing
-            if not observations:
+            if not periods:
                 logger.warning("No observations found with standard parsing, trying fallback")
                 for obs in xml_root.iter():
                     if 'Obs' in obs.tag:
                         # Check if this element has the data we need
+                        obs_time = None
+                        obs_value = None
                         for child in obs:
                             if 'ObsDimension' in child.tag:
                                 obs_time = child.get('value')
@@ -164,29 +221,23 @@ class ECBClient:
                                 obs_value = child.get('value')
                         
                         if obs_time and obs_value:
-                            try:
-                                observations.append({
-                                    'time_period': obs_time,
-                                    'value': float(obs_value)
-                                })
-                            except (ValueError, TypeError):
-                                observations.append({
-                                    'time_period': obs_time,
-                                    'value': None
-                                })
+                            periods.append(obs_time)
+                            raw_values.append(obs_value)
+            
+            # Validate every value in one pass; non-numeric ones are kept as gaps
+            numeric = pd.to_numeric(pd.Series(raw_values, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+            valid = ~np.isnan(numeric)
+            invalid_count = len(valid) - int(valid.sum())
+            if invalid_count:
+                logger.warning(f"Could not convert {invalid_count} values to float")
             
             # Create a JSON-like structure compatible with existing ECB client parsing
             # This mimics the structure that the ECB API would return in JSON format
-            observations_dict = {}
-            time_values = []
-            
-            for i, obs in enumerate(observations):
-                observations_dict[str(i)] = [
-                    str(obs['value']) if obs['value'] is not None else None,
-                    None,  # Status (not used)
-                    None   # Confidence (not used)
-                ]
-                time_values.append({'id': obs['time_period']})
+            observations_dict = {
+                str(i): [raw_value if is_valid else None, None, None]  # value, status, confidence
+                for i, (raw_value, is_valid) in enumerate(zip(raw_values, valid.tolist()))
+            }
+            time_values = [{'id': period} for period in periods]
             
             result = {
                 'dataSets': [{
@@ -206,10 +257,10 @@ class ECBClient:
                 },
                 '_metadata': metadata,
                 '_source': 'local_file',
-                '_observations_count': len(observations)
+                '_observations_count': len(periods)
             }
             
-            logger.info(f"Converted XML to JSON structure with {len(observations)} observations")
+            logger.info(f"Converted XML to JSON structure with {len(periods)} observations")
             return result
             
         except Exception as e:
@@ -234,8 +285,41 @@ class ECBClient:
                 return name
         return None
     
+    def _response_cache_key(self, series_config: dict, start_date: str, end_date: str,
+                            max_observations: int) -> str:
+        """Cache file name for an API request"""
+        request_id = json.dumps(
+            [series_config['resource'], series_config['key'], start_date, end_date, max_observations]
+        )
+        digest = hashlib.md5(request_id.encode('utf-8')).hexdigest()
+        return f"{series_config['resource']}_{digest}"
+    
+    def _load_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached API response if it is younger than the TTL"""
+        if self.cache_ttl <= 0:
+            return None
+        cached = load_json_cache(cache_key, self.cache_dir)
+        if not cached or time.time() - cached.get("ts", 0) > self.cache_ttl:
+            return None
+        return cached.get("data")
+    
+    def _prune_response_cache(self):
+        """Delete cached responses older than the TTL, at most once per TTL period"""
+        now = time.monotonic()
+        if now - self._last_cache_prune < self.cache_ttl:
+            return
+        self._last_cache_prune = now
+        
+        cutoff = time.time() - self.cache_ttl
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                if cache_file.stat().st_mtime < cutoff:
+                    cache_file.unlink()
+            except OSError:
+                pass
+    
     def _make_request(self, series_config: dict, start_date: str = None, end_date: str = None, 
-                     max_observations: int = None) -> Dict[str, Any]:
+                     max_observations: int = None, use_cache: bool = True) -> Dict[str, Any]:
         """Make request to ECB API with SDMX REST format or load from local files"""
         
         # Check if we should use local data
@@ -247,6 +331,14 @@ class ECBClient:
             else:
                 logger.warning(f"No matching series found in config for {series_config}, falling back to API")
         
+        # Serve recent identical requests from the on-disk cache; use_cache=False (forced
+        # refreshes, connection tests) neither reads nor writes it so the API is always reached
+        cache_key = self._response_cache_key(series_config, start_date, end_date, max_observations)
+        cached_response = self._load_cached_response(cache_key) if use_cache else None
+        if cached_response is not None:
+            logger.info(f"Using cached API response for {series_config['resource']}.{series_config['key']}")
+            return cached_response
+        
         # Apply rate limiting for API requests
         self._rate_limit()
         
@@ -269,73 +361,93 @@ class ECBClient:
         if max_observations:
             params["lastNObservations"] = max_observations
         
-        # Retry logic
-        for attempt in range(self.api_config["max_retries"]):
+        # Transient failures (timeouts, connection errors, 5xx) are retried by the session adapter
+        try:
+            logger.info(f"Making API request: {url} with params: {params}")
+            
+            response = self.session.get(
+                url,
+                params=params,
+                timeout=self.timeout
+            )
+        except requests.exceptions.Timeout:
+            raise ECBAPIException("Request timeout after all retries")
+        except requests.exceptions.ConnectionError:
+            raise ECBAPIException("Connection error after all retries")
+        except requests.exceptions.RequestException as e:
+            raise ECBAPIException(f"API request failed: {str(e)}")
+        
+        logger.info(f"Response status: {response.status_code}")
+        logger.info(f"Response headers: {dict(response.headers)}")
+        logger.debug(f"Response content encoding: {response.headers.get('Content-Encoding', 'identity')}")
+        
+        if response.status_code == 200:
             try:
-                logger.info(f"Making API request: {url} with params: {params}")
-                
-                response = self.session.get(
-                    url,
-                    params=params,
-                    timeout=self.api_config["timeout"]
-                )
-                
-                logger.info(f"Response status: {response.status_code}")
-                logger.info(f"Response headers: {dict(response.headers)}")
-                
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 404:
-                    # Log the actual 404 response content to understand what's available
-                    try:
-                        error_content = response.json()
-                        logger.error(f"404 Response content: {error_content}")
-                    except:
-                        logger.error(f"404 Response text: {response.text[:200]}")
-                    
-                    series_id = f"{series_config['resource']}.{series_config['key']}"
-                    logger.error(f"Series not found: {series_id}")
-                    raise SeriesNotFoundException(f"Series not found: {series_id}")
-                elif response.status_code == 429:
-                    logger.error("Rate limit exceeded")
-                    raise RateLimitException("Rate limit exceeded")
-                else:
-                    logger.error(f"API request failed with status {response.status_code}: {response.text[:500]}")
-                    response.raise_for_status()
-                    
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout (attempt {attempt + 1})")
-                if attempt == self.api_config["max_retries"] - 1:
-                    raise ECBAPIException("Request timeout after all retries")
-                    
-            except requests.exceptions.ConnectionError:
-                logger.warning(f"Connection error (attempt {attempt + 1})")
-                if attempt == self.api_config["max_retries"] - 1:
-                    raise ECBAPIException("Connection error after all retries")
-                    
-            except Exception as e:
-                if attempt == self.api_config["max_retries"] - 1:
-                    raise ECBAPIException(f"API request failed: {str(e)}")
+                response_data = orjson.loads(response.content) if orjson else response.json()
+            except ValueError as e:
+                raise ECBAPIException(f"API request failed: invalid JSON response: {str(e)}")
+            del response  # let the raw body go before the trimmed tree is cached
+            response_data = self._trim_response(response_data)
+            # Travels with the cached copy so parsed results never outlive the response they came from
+            response_data["_fetched_at"] = time.time()
+            if use_cache and self.cache_ttl > 0:
+                save_json_cache({"ts": response_data["_fetched_at"], "data": response_data}, cache_key, self.cache_dir)
+                self._prune_response_cache()
+            return response_data
+        elif response.status_code == 404:
+            # Log the actual 404 response content to understand what's available
+            try:
+                error_content = response.json()
+                logger.error(f"404 Response content: {error_content}")
+            except:
+                logger.error(f"404 Response text: {response.text[:200]}")
             
-            # Wait before retry
-            if attempt < self.api_config["max_retries"] - 1:
-                sleep_time = self.api_config["retry_delay"] * (2 ** attempt)
-                logger.debug(f"Retrying in {sleep_time} seconds...")
-                time.sleep(sleep_time)
+            series_id = f"{series_config['resource']}.{series_config['key']}"
+            logger.error(f"Series not found: {series_id}")
+            raise SeriesNotFoundException(f"Series not found: {series_id}")
+        elif response.status_code == 429:
+            logger.error("Rate limit exceeded")
+            raise RateLimitException("Rate limit exceeded")
+        else:
+            logger.error(f"API request failed with status {response.status_code}: {response.text[:500]}")
+            raise ECBAPIException(f"API request failed: {response.status_code} {response.reason}")
+    
+    def _trim_response(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the parts of an SDMX-JSON response that the extractors read"""
+        datasets = response_data.get("dataSets") or []
+        if not datasets:
+            return response_data
+        
+        series_data = datasets[0].get("series") or {}
+        first_series_key = next(iter(series_data), None)
+        trimmed_series = {}
+        if first_series_key is not None:
+            trimmed_series[first_series_key] = {
+                "observations": series_data[first_series_key].get("observations", {})
+            }
         
-        raise ECBAPIException("All retry attempts failed")
+        structure = response_data.get("structure") or {}
+        return {
+            "dataSets": [{"series": trimmed_series}],
+            "structure": {
+                "dimensions": {"observation": structure.get("dimensions", {}).get("observation", [])},
+                "attributes": {"series": structure.get("attributes", {}).get("series", [])}
+            }
+        }
     
     def _parse_response(self, response_data: Dict[str, Any], series_key: str) -> ECBSeriesData:
         """Parse ECB API response to internal data structure"""
         try:
-            # Create API response model
-            api_response = ECBAPIResponse(**response_data)
+            # Full model validation only when debugging; the extractors walk plain dicts anyway
+            if self.strict_parse:
+                ECBAPIResponse(**response_data)
             
-            if not api_response.dataSets:
+            datasets = response_data.get("dataSets") or []
+            if not datasets:
                 raise DataParsingException("No datasets in response")
             
-            dataset = api_response.dataSets[0]
-            structure = api_response.structure
+            dataset = datasets[0]
+            structure = response_data.get("structure") or {}
             
             # Extract metadata
             metadata = self._extract_metadata(structure, series_key)
@@ -344,14 +456,8 @@ class ECBClient:
             observations = self._extract_observations(dataset, structure)
             
             # Create appropriate data model based on series type
-            if "EXR" in series_key:
-                return ExchangeRateData(metadata=metadata, observations=observations)
-            elif "ICP" in series_key:
-                return InflationData(metadata=metadata, observations=observations)
-            elif "FM" in series_key:
-                return InterestRateData(metadata=metadata, observations=observations)
-            else:
-                return ECBSeriesData(metadata=metadata, observations=observations)
+            series_type = SERIES_TYPE_BY_RESOURCE.get(series_key.partition(".")[0], ECBSeriesData)
+            return series_type.from_trusted(metadata, observations)
                 
         except Exception as e:
             raise DataParsingException(f"Failed to parse response: {str(e)}")
@@ -359,32 +465,17 @@ class ECBClient:
     def _extract_metadata(self, structure: Dict[str, Any], series_key: str) -> SeriesMetadata:
         """Extract metadata from API response structure"""
         try:
-            # Get title from structure
-            title = "Unknown"
-            if "attributes" in structure:
-                for attr in structure["attributes"].get("series", []):
-                    if attr.get("id") == "TITLE":
-                        values = attr.get("values", [])
-                        if values:
-                            title = values[0].get("name", "Unknown")
-                        break
+            # Index series attributes once so TITLE and UNIT are plain lookups
+            attrs_by_id = {
+                attr.get("id"): attr.get("values") or [{}]
+                for attr in structure.get("attributes", {}).get("series", [])
+            }
+            title = attrs_by_id.get("TITLE", [{}])[0].get("name", "Unknown")
+            unit = attrs_by_id.get("UNIT", [{}])[0].get("name")
             
-            # Determine frequency from series key
-            frequency = SeriesFrequency.DAILY
-            if series_key.startswith("EXR.D"):
-                frequency = SeriesFrequency.DAILY
-            elif series_key.startswith("EXR.M") or "M." in series_key:
-                frequency = SeriesFrequency.MONTHLY
-            
-            # Extract unit
-            unit = None
-            if "attributes" in structure:
-                for attr in structure["attributes"].get("series", []):
-                    if attr.get("id") == "UNIT":
-                        values = attr.get("values", [])
-                        if values:
-                            unit = values[0].get("name")
-                        break
+            # Frequency is the first dimension of the key (e.g. EXR.D.USD.EUR.SP00.A)
+            frequency_code = series_key.partition(".")[2][:1]
+            frequency = FREQUENCY_BY_CODE.get(frequency_code, SeriesFrequency.DAILY)
             
             return SeriesMetadata(
                 series_key=series_key,
@@ -435,75 +526,144 @@ class ECBClient:
             # Extract time values
             time_values = time_dimension.get("values", [])
             
-            # Process observations
+            # Collect periods and raw values column-wise
+            periods = []
+            raw_values = []
             for obs_index, obs_value in obs_data.items():
                 try:
                     index = int(obs_index)
-                    if index < len(time_values):
-                        period = time_values[index].get("id", "")
-                        value = obs_value[0] if obs_value and len(obs_value) > 0 else None
-                        
-                        # Convert value to float if possible
-                        if value is not None:
-                            try:
-                                value = float(value)
-                            except (ValueError, TypeError):
-                                value = None
-                        
-                        if period and value is not None:
-                            observations.append(ECBObservation(
-                                period=period,
-                                value=value,
-                                status=ObservationStatus.NORMAL
-                            ))
-                            
-                except (ValueError, IndexError) as e:
+                except ValueError as e:
                     logger.warning(f"Skipping malformed observation {obs_index}: {e}")
                     continue
+                if index < len(time_values):
+                    periods.append(time_values[index].get("id", ""))
+                    raw_values.append(obs_value[0] if obs_value else None)
+            
+            # Convert all values in one pass; anything non-numeric becomes NaN and is dropped
+            values = pd.to_numeric(pd.Series(raw_values, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            
+            observations = [
+                ECBObservation.from_trusted(period=period, value=value, status=ObservationStatus.NORMAL)
+                for period, value, is_valid in zip(periods, values.tolist(), valid.tolist())
+                if is_valid and period
+            ]
                     
         except Exception as e:
             logger.error(f"Failed to extract observations: {e}")
         
         return observations
     
-    def fetch_exchange_rates(self, start_date: str = None, end_date: str = None) -> DataFetchResult:
+    def fetch_exchange_rates(self, start_date: str = None, end_date: str = None,
+                             use_cache: bool = True) -> DataFetchResult:
         """Fetch EUR/USD exchange rates"""
         series_config = self.series_config["EUR_USD_DAILY"]
         
         if not start_date or not end_date:
             start_date, end_date = get_default_date_range()
         
-        return self._fetch_series(series_config, start_date, end_date)
+        return self._fetch_series(series_config, start_date, end_date, use_cache)
     
-    def fetch_inflation_data(self, start_date: str = None, end_date: str = None) -> DataFetchResult:
+    def fetch_inflation_data(self, start_date: str = None, end_date: str = None,
+                             use_cache: bool = True) -> DataFetchResult:
         """Fetch inflation data"""
         series_config = self.series_config["INFLATION_MONTHLY"]
         
         if not start_date or not end_date:
             start_date, end_date = get_default_date_range()
         
-        return self._fetch_series(series_config, start_date, end_date)
+        return self._fetch_series(series_config, start_date, end_date, use_cache)
     
-    def fetch_interest_rates(self, start_date: str = None, end_date: str = None) -> DataFetchResult:
+    def fetch_interest_rates(self, start_date: str = None, end_date: str = None,
+                             use_cache: bool = True) -> DataFetchResult:
         """Fetch interest rates"""
         series_config = self.series_config["ECB_MAIN_RATE"]
         
         if not start_date or not end_date:
             start_date, end_date = get_default_date_range()
         
-        return self._fetch_series(series_config, start_date, end_date)
+        return self._fetch_series(series_config, start_date, end_date, use_cache)
     
-    def _fetch_series(self, series_config: dict, start_date: str, end_date: str) -> DataFetchResult:
-        """Generic method to fetch any series"""
+    def fetch_all(self, series_names: Optional[List[str]] = None,
+                  start_date: str = None, end_date: str = None,
+                  use_cache: bool = True) -> Dict[str, DataFetchResult]:
+        """Fetch the dashboard series concurrently, keyed by series name"""
+        fetchers = {
+            "EUR_USD_DAILY": self.fetch_exchange_rates,
+            "INFLATION_MONTHLY": self.fetch_inflation_data,
+            "ECB_MAIN_RATE": self.fetch_interest_rates
+        }
+        if series_names is not None:
+            fetchers = {name: fetchers[name] for name in series_names}
+        if not fetchers:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = {
+                name: executor.submit(fetch, start_date, end_date, use_cache)
+                for name, fetch in fetchers.items()
+            }
+        
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.error(f"Error fetching {name}: {e}")
+                results[name] = DataFetchResult(
+                    success=False,
+                    series_key=name,
+                    error_message=str(e)
+                )
+        return results
+    
+    def _get_parsed_series(self, cache_key: tuple) -> Optional[ECBSeriesData]:
+        """Return a parsed series from the in-process cache if its response is still within the TTL"""
+        if self.cache_ttl <= 0:
+            return None
+        with self._parsed_cache_lock:
+            entry = self._parsed_cache.get(cache_key)
+            if entry is None:
+                return None
+            fetched_at, series_data = entry
+            if time.time() - fetched_at > self.cache_ttl:
+                del self._parsed_cache[cache_key]
+                return None
+            self._parsed_cache.move_to_end(cache_key)
+            return series_data
+    
+    def _store_parsed_series(self, cache_key: tuple, series_data: ECBSeriesData, fetched_at: float):
+        """Remember a parsed series, evicting the least recently used entry when full"""
+        if self.cache_ttl <= 0:
+            return
+        with self._parsed_cache_lock:
+            self._parsed_cache[cache_key] = (fetched_at, series_data)
+            self._parsed_cache.move_to_end(cache_key)
+            while len(self._parsed_cache) > self._parsed_cache_size:
+                self._parsed_cache.popitem(last=False)
+    
+    def _fetch_series(self, series_config: dict, start_date: str, end_date: str,
+                      use_cache: bool = True) -> DataFetchResult:
+        """Generic method to fetch any series; use_cache=False always goes to the API"""
         try:
             series_id = f"{series_config['resource']}.{series_config['key']}"
             logger.info(f"Fetching series {series_id} from {start_date} to {end_date}")
             
-            # Make API request
-            response_data = self._make_request(series_config, start_date, end_date)
-            
-            # Parse response
-            series_data = self._parse_response(response_data, series_id)
+            # A forced fetch skips the parsed-series cache as well as the response cache
+            cache_key = (series_id, start_date, end_date, self.use_local_data)
+            series_data = self._get_parsed_series(cache_key) if use_cache else None
+            if series_data is not None:
+                logger.info(f"Using cached parsed data for {series_id}")
+            else:
+                # Make API request
+                response_data = self._make_request(series_config, start_date, end_date,
+                                                   use_cache=use_cache)
+                
+                # Parse response
+                series_data = self._parse_response(response_data, series_id)
+                if use_cache:
+                    self._store_parsed_series(cache_key, series_data,
+                                              response_data.get("_fetched_at", time.time()))
             
             logger.info(f"Successfully fetched {len(series_data.observations)} observations for {series_id}")
             
@@ -585,7 +745,7 @@ class ECBClient:
             logger.info("Trying to browse available exchange rate series...")
             try:
                 test_config = self.series_config["EUR_USD_TEST1"]
-                browse_result = self._make_request(test_config, max_observations=1)
+                browse_result = self._make_request(test_config, max_observations=1, use_cache=False)
                 logger.info(f"Browse result available: {bool(browse_result)}")
                 if browse_result:
                     return True
@@ -596,7 +756,8 @@ class ECBClient:
             eur_usd_config = self.series_config["EUR_USD_DAILY"]
             result = self._make_request(
                 eur_usd_config, 
-                max_observations=1
+                max_observations=1,
+                use_cache=False
             )
             return bool(result)
         except Exception as e:
@@ -605,8 +766,13 @@ class ECBClient:
             try:
                 logger.info("Trying simple request without parameters...")
                 eur_usd_config = self.series_config["EUR_USD_DAILY"]
-                simple_result = self._make_request(eur_usd_config)
+                simple_result = self._make_request(eur_usd_config, use_cache=False)
                 return bool(simple_result)
             except Exception as e2:
                 logger.error(f"Simple API connection test also failed: {e2}")
                 return False
+
+@lru_cache(maxsize=1)
+def get_ecb_client() -> ECBClient:
+    """Get the shared ECB client so its connection pool survives across callers"""
+    return ECBClient()
@@ -1,8 +1,8 @@
 """
 Authentication module for ECB Financial Data Visualizer
 """
-from .auth_service import AuthService
+from .auth_service import AuthService, get_auth_service
 from .crypto_service import DatabaseCryptoService
 from .middleware import require_authentication
 
-__all__ = ['AuthService', 'DatabaseCryptoService', 'require_authentication']
\ No newline at end of file
+__all__ = ['AuthService', 'get_auth_service', 'DatabaseCryptoService', 'require_authentication']
\ No newline at end of file
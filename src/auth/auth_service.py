@@ -3,9 +3,15 @@ Authentication service for ECB Financial Data Visualizer
 Handles PIN validation and secure session management
 """
 import hashlib
+import hmac
 import secrets
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime
 from typing import Dict, Optional, Tuple
 from utils.config import get_config
 from utils.logging_config import get_logger
@@ -13,6 +19,24 @@ from utils.pin_hasher import PINHasher
 
 logger = get_logger(__name__)
 
+# Concurrent bcrypt checks allowed, and how long a login waits for one
+PIN_VERIFY_WORKERS = 2
+PIN_VERIFY_TIMEOUT_SECONDS = 2.0
+
+class PINVerifierBusy(Exception):
+    """Every PIN verification slot is in use"""
+    pass
+
+# Upper bound on clients tracked for failed logins, so scan traffic can't grow memory without limit
+MAX_TRACKED_CLIENTS = 100_000
+
+@dataclass(slots=True)
+class SessionData:
+    """Authenticated session state, timestamps on the monotonic clock"""
+    created_at: float
+    last_activity: float
+    client_ip: str
+
 class AuthService:
     """Authentication service with bcrypt PIN validation"""
     
@@ -23,10 +47,33 @@ class AuthService:
         self.session_timeout = self.security_config["session_timeout_minutes"]
         self.max_attempts = self.security_config["max_login_attempts"]
         self.lockout_duration = self.security_config["lockout_duration_minutes"]
+        self.session_timeout_seconds = self.session_timeout * 60
+        self.lockout_duration_seconds = self.lockout_duration * 60
+        
+        # In-memory session storage (cleared on restart); the lock covers request threads
+        self.active_sessions: Dict[str, SessionData] = {}
+        self._sessions_lock = threading.Lock()
+        
+        # Failed logins per client, oldest activity first; entries expire after twice the lockout
+        self.failed_attempts: "OrderedDict[str, dict]" = OrderedDict()
+        self._attempts_lock = threading.Lock()
+        self.failed_attempts_ttl_seconds = self.lockout_duration_seconds * 2
+        
+        # Bounded pool so bursts of login attempts can't tie up every request thread in bcrypt.
+        # A slot is held until the hash finishes, so nothing ever queues behind the workers
+        self._pin_executor = ThreadPoolExecutor(max_workers=PIN_VERIFY_WORKERS, thread_name_prefix="pin-verify")
+        self._pin_slots = threading.BoundedSemaphore(PIN_VERIFY_WORKERS)
+        
+        # Recently verified PINs, keyed by an HMAC under a per-process key; failures are never cached
+        self._verified_pin_key = secrets.token_bytes(32)
+        self._verified_pins: Dict[bytes, float] = {}
+        
+        # Offset for turning monotonic timestamps back into wall-clock times
+        self._wall_clock_offset = time.time() - time.monotonic()
         
-        # In-memory session storage (cleared on restart)
-        self.active_sessions: Dict[str, dict] = {}
-        self.failed_attempts: Dict[str, dict] = {}
+        # Expired sessions are swept in the background rather than waiting for a lookup
+        self._gc_thread = threading.Thread(target=self._gc_loop, name="session-gc", daemon=True)
+        self._gc_thread.start()
         
         logger.info("Authentication service initialized with secure PIN hashing")
     
@@ -55,13 +102,21 @@ class AuthService:
                 return False, "PIN must be exactly 6 digits"
 
             # Verify PIN against bcrypt hash
-            if PINHasher.verify_pin(pin, self.pin_hash):
+            try:
+                pin_ok = self._verify_pin(pin)
+            except PINVerifierBusy:
+                logger.warning(f"PIN verification busy, rejected attempt from {client_ip}")
+                return False, "Authentication is busy. Please try again in a moment."
+            except FutureTimeoutError:
+                pin_ok = False
+                logger.warning(f"PIN verification timed out for {client_ip}")
+            
+            if pin_ok:
                 self._clear_failed_attempts(client_ip)
                 logger.info(f"Successful PIN validation from {client_ip}")
                 return True, ""
             else:
-                self._record_failed_attempt(client_ip)
-                attempts_left = self.max_attempts - self.failed_attempts[client_ip]["count"]
+                attempts_left = self.max_attempts - self._record_failed_attempt(client_ip)
                 logger.warning(f"Failed PIN validation from {client_ip}. Attempts left: {attempts_left}")
                 return False, f"Invalid PIN. {attempts_left} attempts remaining."
                 
@@ -69,6 +124,28 @@ class AuthService:
             logger.error(f"Error validating PIN: {e}")
             return False, "Authentication error. Please try again."
     
+    def _verify_pin(self, pin: str) -> bool:
+        """Check the PIN with bcrypt, skipping the hash for a PIN verified within the session timeout"""
+        pin_digest = hmac.new(self._verified_pin_key, pin.encode('utf-8'), hashlib.sha256).digest()
+        verified_at = self._verified_pins.get(pin_digest)
+        if verified_at is not None and time.monotonic() - verified_at < self.session_timeout_seconds:
+            return True
+        
+        if not self._pin_slots.acquire(blocking=False):
+            raise PINVerifierBusy()
+        try:
+            future = self._pin_executor.submit(PINHasher.verify_pin, pin, self.pin_hash)
+        except BaseException:
+            self._pin_slots.release()
+            raise
+        future.add_done_callback(lambda _: self._pin_slots.release())
+        
+        if not future.result(timeout=PIN_VERIFY_TIMEOUT_SECONDS):
+            return False
+        
+        self._verified_pins[pin_digest] = time.monotonic()
+        return True
+    
     def create_session(self, client_ip: str = "unknown") -> str:
         """
         Create a new authenticated session
@@ -84,15 +161,12 @@ class AuthService:
             session_token = secrets.token_urlsafe(32)
             
             # Create session data
-            session_data = {
-                "created_at": datetime.now(),
-                "last_activity": datetime.now(),
-                "client_ip": client_ip,
-                "authenticated": True
-            }
+            now = time.monotonic()
+            session_data = SessionData(created_at=now, last_activity=now, client_ip=client_ip)
             
             # Store session
-            self.active_sessions[session_token] = session_data
+            with self._sessions_lock:
+                self.active_sessions[session_token] = session_data
             
             logger.info(f"Created session {session_token[:8]}... for {client_ip}")
             return session_token
@@ -112,22 +186,22 @@ class AuthService:
             True if session is valid
         """
         try:
-            if not session_token or session_token not in self.active_sessions:
+            if not session_token:
                 return False
             
-            session_data = self.active_sessions[session_token]
+            session_data = self.active_sessions.get(session_token)
+            if session_data is None:
+                return False
             
             # Check if session is expired
-            last_activity = session_data["last_activity"]
-            timeout_delta = timedelta(minutes=self.session_timeout)
-            
-            if datetime.now() - last_activity > timeout_delta:
+            now = time.monotonic()
+            if now - session_data.last_activity > self.session_timeout_seconds:
                 self._destroy_session(session_token)
                 logger.info(f"Session {session_token[:8]}... expired")
                 return False
             
             # Update last activity
-            session_data["last_activity"] = datetime.now()
+            session_data.last_activity = now
             return True
             
         except Exception as e:
@@ -149,10 +223,10 @@ class AuthService:
     def _destroy_session(self, session_token: str) -> bool:
         """Internal method to destroy session"""
         try:
-            if session_token in self.active_sessions:
-                client_ip = self.active_sessions[session_token].get("client_ip", "unknown")
-                del self.active_sessions[session_token]
-                logger.info(f"Destroyed session {session_token[:8]}... for {client_ip}")
+            with self._sessions_lock:
+                session_data = self.active_sessions.pop(session_token, None)
+            if session_data is not None:
+                logger.info(f"Destroyed session {session_token[:8]}... for {session_data.client_ip}")
                 return True
             return False
         except Exception as e:
@@ -161,16 +235,15 @@ class AuthService:
     
     def _is_client_locked_out(self, client_ip: str) -> bool:
         """Check if client is locked out due to failed attempts"""
-        if client_ip not in self.failed_attempts:
+        attempt_data = self.failed_attempts.get(client_ip)
+        if attempt_data is None:
             return False
         
-        attempt_data = self.failed_attempts[client_ip]
-        
         # Check if lockout period has expired
         if "locked_until" in attempt_data:
-            if datetime.now() > attempt_data["locked_until"]:
+            if time.monotonic() > attempt_data["locked_until"]:
                 # Lockout expired, clear failed attempts
-                del self.failed_attempts[client_ip]
+                self._clear_failed_attempts(client_ip)
                 return False
             return True
         
@@ -178,52 +251,73 @@ class AuthService:
     
     def _get_lockout_remaining_time(self, client_ip: str) -> int:
         """Get remaining lockout time in minutes"""
-        if client_ip not in self.failed_attempts or "locked_until" not in self.failed_attempts[client_ip]:
+        attempt_data = self.failed_attempts.get(client_ip)
+        if attempt_data is None or "locked_until" not in attempt_data:
             return 0
         
-        locked_until = self.failed_attempts[client_ip]["locked_until"]
-        remaining = locked_until - datetime.now()
-        return max(0, int(remaining.total_seconds() / 60))
+        remaining = attempt_data["locked_until"] - time.monotonic()
+        return max(0, int(remaining / 60))
     
-    def _record_failed_attempt(self, client_ip: str):
-        """Record a failed login attempt"""
-        if client_ip not in self.failed_attempts:
-            self.failed_attempts[client_ip] = {"count": 0, "first_attempt": datetime.now()}
-        
-        self.failed_attempts[client_ip]["count"] += 1
-        self.failed_attempts[client_ip]["last_attempt"] = datetime.now()
-        
-        # Check if client should be locked out
-        if self.failed_attempts[client_ip]["count"] >= self.max_attempts:
-            lockout_until = datetime.now() + timedelta(minutes=self.lockout_duration)
-            self.failed_attempts[client_ip]["locked_until"] = lockout_until
-            logger.warning(f"Client {client_ip} locked out until {lockout_until}")
+    def _record_failed_attempt(self, client_ip: str) -> int:
+        """Record a failed login attempt and return the client's attempt count"""
+        now = time.monotonic()
+        with self._attempts_lock:
+            # Entries are kept in last-attempt order, so expired ones sit at the front
+            while self.failed_attempts:
+                oldest = next(iter(self.failed_attempts.values()))
+                if now - oldest["last_attempt"] <= self.failed_attempts_ttl_seconds:
+                    break
+                self.failed_attempts.popitem(last=False)
+            
+            attempt_data = self.failed_attempts.get(client_ip)
+            if attempt_data is None:
+                attempt_data = self.failed_attempts[client_ip] = {"count": 0, "first_attempt": now}
+            else:
+                self.failed_attempts.move_to_end(client_ip)
+            
+            attempt_data["count"] += 1
+            attempt_data["last_attempt"] = now
+            
+            # Check if client should be locked out
+            if attempt_data["count"] >= self.max_attempts:
+                attempt_data["locked_until"] = now + self.lockout_duration_seconds
+                logger.warning(f"Client {client_ip} locked out until {self._to_iso(attempt_data['locked_until'])}")
+            
+            while len(self.failed_attempts) > MAX_TRACKED_CLIENTS:
+                self.failed_attempts.popitem(last=False)
+            
+            return attempt_data["count"]
     
     def _clear_failed_attempts(self, client_ip: str):
         """Clear failed attempts for successful login"""
-        if client_ip in self.failed_attempts:
-            del self.failed_attempts[client_ip]
+        with self._attempts_lock:
+            self.failed_attempts.pop(client_ip, None)
     
     def get_session_info(self, session_token: str) -> Optional[dict]:
         """Get information about a session"""
-        if session_token in self.active_sessions:
-            session_data = self.active_sessions[session_token].copy()
-            # Convert datetime objects to strings for JSON serialization
-            session_data["created_at"] = session_data["created_at"].isoformat()
-            session_data["last_activity"] = session_data["last_activity"].isoformat()
-            return session_data
-        return None
+        session_data = self.active_sessions.get(session_token)
+        if session_data is None:
+            return None
+        return {
+            "created_at": self._to_iso(session_data.created_at),
+            "last_activity": self._to_iso(session_data.last_activity),
+            "client_ip": session_data.client_ip,
+            "authenticated": True
+        }
+    
+    def _to_iso(self, monotonic_timestamp: float) -> str:
+        """Convert a monotonic timestamp to an ISO wall-clock string"""
+        return datetime.fromtimestamp(monotonic_timestamp + self._wall_clock_offset).isoformat()
     
     def cleanup_expired_sessions(self):
         """Clean up expired sessions (can be called periodically)"""
         try:
-            current_time = datetime.now()
-            timeout_delta = timedelta(minutes=self.session_timeout)
-            expired_sessions = []
-            
-            for token, session_data in self.active_sessions.items():
-                if current_time - session_data["last_activity"] > timeout_delta:
-                    expired_sessions.append(token)
+            current_time = time.monotonic()
+            with self._sessions_lock:
+                expired_sessions = [
+                    token for token, session_data in self.active_sessions.items()
+                    if current_time - session_data.last_activity > self.session_timeout_seconds
+                ]
             
             for token in expired_sessions:
                 self._destroy_session(token)
@@ -234,6 +328,18 @@ class AuthService:
         except Exception as e:
             logger.error(f"Error cleaning up sessions: {e}")
     
+    def _gc_loop(self):
+        """Periodically remove expired sessions"""
+        interval = max(1.0, self.session_timeout_seconds / 4)
+        while True:
+            time.sleep(interval)
+            self.cleanup_expired_sessions()
+    
     def get_active_session_count(self) -> int:
         """Get count of active sessions"""
-        return len(self.active_sessions)
\ No newline at end of file
+        return len(self.active_sessions)
+
+@lru_cache(maxsize=1)
+def get_auth_service() -> AuthService:
+    """Get the shared authentication service"""
+    return AuthService()
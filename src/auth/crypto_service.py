@@ -2,14 +2,25 @@
 Database encryption service for ECB Financial Data Visualizer
 Handles SQLite database encryption/decryption using PIN-derived keys
 """
+import hashlib
+import hmac
+import mmap
 import os
+import secrets
 import shutil
 import sqlite3
+import struct
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 import base64
 
 from utils.config import get_config
@@ -17,6 +28,49 @@ from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# rfernet (Rust bindings, same token format) is optional - fall back to cryptography's Fernet
+try:
+    from rfernet import Fernet as RustFernet
+except ImportError:
+    RustFernet = None
+
+def new_fernet(key: bytes):
+    """Build a Fernet for a urlsafe-base64 key, preferring the Rust implementation"""
+    if RustFernet is not None:
+        return RustFernet(key.decode('ascii'))
+    return Fernet(key)
+
+# Chunked AES-GCM file format: header (magic, version, chunk size, file salt, base nonce),
+# then one ciphertext+tag per chunk. Files without the magic are legacy whole-file Fernet tokens.
+ENCRYPTION_MAGIC = b'ECBE'
+ENCRYPTION_FORMAT_VERSION = 2
+PBKDF2_FORMAT_VERSION = 1  # version 1 files and legacy Fernet tokens use a PBKDF2 PIN key
+ENCRYPTION_CHUNK_SIZE = 128 * 1024
+ENCRYPTION_HEADER = struct.Struct('<4sBI16s8s')
+AEAD_TAG_SIZE = 16
+
+# scrypt cost for the PIN key of version 2 files (~16 MB of memory per derivation)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+# Files SQLite keeps next to the database in WAL mode; they hold plaintext pages too
+SQLITE_SIDECAR_SUFFIXES = ('-wal', '-shm')
+
+# How long get_database_status() may reuse its file stats
+STATUS_CACHE_TTL_SECONDS = 1.0
+
+# Chunks are sealed independently, so they can be spread over a small thread pool
+CRYPTO_WORKERS = min(8, os.cpu_count() or 1)
+
+def chunk_nonce(base_nonce: bytes, index: int) -> bytes:
+    """96-bit nonce for a chunk: the file's random 64-bit prefix plus the chunk index"""
+    return base_nonce + struct.pack('<I', index)
+
+def chunk_aad(header: bytes, index: int, is_last: bool) -> bytes:
+    """Bind each chunk to the header, its position and whether it ends the file"""
+    return header + struct.pack('<I?', index, is_last)
+
 class DatabaseCryptoService:
     """Service for encrypting and decrypting SQLite database files"""
     
@@ -29,6 +83,16 @@ class DatabaseCryptoService:
         # Fixed salt for consistency (in production, store this securely)
         self.salt = b'ecb_financial_visualizer_salt_2024'
         
+        # Cached results of is_database_encrypted() / get_database_status(); reset whenever this service changes the files
+        self._is_encrypted: Optional[bool] = None
+        self._status_cache: Optional[Tuple[float, dict]] = None
+        
+        # PIN-derived keys, cached under an HMAC of the PIN with a per-process key; cleared on lock
+        self._key_cache_secret = secrets.token_bytes(32)
+        self._key_cache: Dict[bytes, bytes] = {}
+        # Ready-to-use AES-GCM ciphers by (PIN key, file salt), so unlocking the same file again skips setup
+        self._cipher_cache: Dict[Tuple[bytes, bytes], AESGCM] = {}
+        
         logger.info("Database encryption service initialized")
     
     def is_database_encrypted(self) -> bool:
@@ -38,27 +102,45 @@ class DatabaseCryptoService:
         Returns:
             True if database is encrypted
         """
+        if self._is_encrypted is not None:
+            return self._is_encrypted
+        
         try:
             # Check if encrypted file exists and original doesn't
-            encrypted_exists = self.encrypted_db_path.exists()
-            original_exists = self.database_path.exists()
+            encrypted_exists = self._stat_once(self.encrypted_db_path) is not None
+            original_exists = self._stat_once(self.database_path) is not None
             
             if encrypted_exists and not original_exists:
-                return True
+                self._is_encrypted = True
             elif original_exists and not encrypted_exists:
-                return False
+                self._is_encrypted = False
             elif not encrypted_exists and not original_exists:
                 # No database exists yet
-                return False
+                self._is_encrypted = False
             else:
                 # Both exist - something went wrong, prefer encrypted
                 logger.warning("Both encrypted and unencrypted database files exist")
-                return True
+                self._is_encrypted = True
+            
+            return self._is_encrypted
                 
         except Exception as e:
             logger.error(f"Error checking database encryption status: {e}")
             return False
     
+    def _invalidate_encryption_status(self):
+        """Forget the cached encryption and file status after the database files change"""
+        self._is_encrypted = None
+        self._status_cache = None
+    
+    @staticmethod
+    def _stat_once(path: Path) -> Optional[os.stat_result]:
+        """Stat a path with a single syscall, returning None if it doesn't exist"""
+        try:
+            return path.stat()
+        except FileNotFoundError:
+            return None
+    
     def encrypt_database(self, pin: str) -> Tuple[bool, str]:
         """
         Encrypt the database file using PIN-derived key
@@ -79,26 +161,23 @@ class DatabaseCryptoService:
                 logger.info("Database is already encrypted")
                 return True, ""
             
+            # Close pooled connections, then fold the WAL into the main file so the encrypted copy is complete
+            self._dispose_database_engine()
+            if not self._checkpoint_wal():
+                return False, "Failed to checkpoint database WAL"
+            
             # Create backup
             if not self._create_backup():
                 return False, "Failed to create database backup"
             
-            # Derive encryption key from PIN
-            key = self._derive_key_from_pin(pin)
-            fernet = Fernet(key)
-            
-            # Read and encrypt database file
-            with open(self.database_path, 'rb') as f:
-                plaintext_data = f.read()
-            
-            encrypted_data = fernet.encrypt(plaintext_data)
-            
-            # Write encrypted file
-            with open(self.encrypted_db_path, 'wb') as f:
-                f.write(encrypted_data)
+            # Stream the database through AES-GCM chunk by chunk; the encrypted file only
+            # appears once fully written, so the plaintext is untouched if this fails
+            self._encrypt_file(self.database_path, self.encrypted_db_path, pin)
             
-            # Remove original unencrypted file
+            # Remove original unencrypted file and its (now empty) WAL/shared-memory files
             os.remove(self.database_path)
+            self._remove_sidecar_files()
+            self._invalidate_encryption_status()
             
             logger.info("Database encrypted successfully")
             return True, ""
@@ -126,23 +205,19 @@ class DatabaseCryptoService:
             if not self.encrypted_db_path.exists():
                 return False, "Encrypted database file not found"
             
-            # Derive encryption key from PIN
-            key = self._derive_key_from_pin(pin)
-            fernet = Fernet(key)
-            
-            # Read and decrypt database file
-            with open(self.encrypted_db_path, 'rb') as f:
-                encrypted_data = f.read()
+            # A WAL left over from another copy of the database must not be replayed onto this one
+            self._remove_sidecar_files()
             
             try:
-                decrypted_data = fernet.decrypt(encrypted_data)
+                if self._is_chunked_file(self.encrypted_db_path):
+                    self._decrypt_file(self.encrypted_db_path, self.database_path, pin)
+                else:
+                    self._decrypt_legacy_file(self.encrypted_db_path, self.database_path, pin)
             except Exception as decrypt_error:
                 logger.error(f"Failed to decrypt database: {decrypt_error}")
+                self.clear_key_cache()
                 return False, "Invalid PIN - cannot decrypt database"
-            
-            # Write decrypted file
-            with open(self.database_path, 'wb') as f:
-                f.write(decrypted_data)
+            self._invalidate_encryption_status()
             
             # Verify the decrypted file is a valid SQLite database
             if not self._verify_sqlite_database():
@@ -164,14 +239,179 @@ class DatabaseCryptoService:
             Tuple of (success, error_message)
         """
         try:
+            self.clear_key_cache()
+            self._remove_sidecar_files()
             if self.database_path.exists():
                 os.remove(self.database_path)
+                self._invalidate_encryption_status()
                 logger.info("Database locked (decrypted file removed)")
             return True, ""
         except Exception as e:
             logger.error(f"Error locking database: {e}")
             return False, f"Failed to lock database: {str(e)}"
     
+    def _sidecar_paths(self) -> list:
+        """Paths of the SQLite WAL/shared-memory files for the decrypted database"""
+        return [self.database_path.with_name(self.database_path.name + suffix) for suffix in SQLITE_SIDECAR_SUFFIXES]
+    
+    def _remove_sidecar_files(self):
+        """Delete the WAL/shared-memory files belonging to the decrypted database"""
+        self._dispose_database_engine()
+        for path in self._sidecar_paths():
+            path.unlink(missing_ok=True)
+    
+    def _dispose_database_engine(self):
+        """Close pooled connections so none keeps the WAL/shared-memory files open or recreates them"""
+        # Only an already-imported manager is disposed; importing it here would create the database
+        database_module = sys.modules.get("database.database")
+        db_manager = getattr(database_module, "db_manager", None)
+        if db_manager is not None and db_manager.engine is not None:
+            db_manager.engine.dispose()
+    
+    def _checkpoint_wal(self) -> bool:
+        """Write WAL contents back into the database file and truncate the WAL"""
+        try:
+            conn = sqlite3.connect(self.database_path)
+            try:
+                busy, _, _ = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"WAL checkpoint before encryption failed: {e}")
+            return False
+        if busy:
+            logger.error("WAL checkpoint before encryption was blocked by another connection")
+            return False
+        return True
+    
+    def _get_pin_key(self, pin: str, version: int = ENCRYPTION_FORMAT_VERSION) -> bytes:
+        """Get the raw 32-byte key for a PIN and file format, running the key derivation only on first use"""
+        cache_key = hmac.new(self._key_cache_secret, f"{version}:{pin}".encode('utf-8'), hashlib.sha256).digest()
+        pin_key = self._key_cache.get(cache_key)
+        if pin_key is None:
+            if version == PBKDF2_FORMAT_VERSION:
+                pin_key = self._derive_key_from_pin(pin)
+            else:
+                pin_key = self._derive_scrypt_key_from_pin(pin)
+            self._key_cache[cache_key] = pin_key
+        return pin_key
+    
+    def _file_cipher(self, pin_key: bytes, file_salt: bytes) -> AESGCM:
+        """AES-GCM cipher under a per-file key expanded from the PIN key"""
+        cipher = self._cipher_cache.get((pin_key, file_salt))
+        if cipher is None:
+            file_key = HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=file_salt,
+                info=b'ecb-database-chunks',
+            ).derive(pin_key)
+            cipher = AESGCM(file_key)
+            self._cipher_cache[(pin_key, file_salt)] = cipher
+        return cipher
+    
+    def _is_chunked_file(self, path: Path) -> bool:
+        """Check whether an encrypted file uses the chunked AES-GCM format"""
+        with open(path, 'rb') as f:
+            return f.read(len(ENCRYPTION_MAGIC)) == ENCRYPTION_MAGIC
+    
+    def _encrypt_file(self, source: Path, target: Path, pin: str):
+        """Encrypt source into target in ENCRYPTION_CHUNK_SIZE pieces"""
+        file_salt = os.urandom(16)
+        base_nonce = os.urandom(8)
+        header = ENCRYPTION_HEADER.pack(
+            ENCRYPTION_MAGIC, ENCRYPTION_FORMAT_VERSION, ENCRYPTION_CHUNK_SIZE, file_salt, base_nonce
+        )
+        aead = self._file_cipher(self._get_pin_key(pin, ENCRYPTION_FORMAT_VERSION), file_salt)
+        
+        def seal(index: int, chunk: bytes, is_last: bool) -> bytes:
+            return aead.encrypt(chunk_nonce(base_nonce, index), chunk, chunk_aad(header, index, is_last))
+        
+        with open(source, 'rb') as src, self._atomic_output(target) as dst:
+            dst.write(header)
+            self._transform_chunks(src, dst, ENCRYPTION_CHUNK_SIZE, seal)
+    
+    def _decrypt_file(self, source: Path, target: Path, pin: str):
+        """Decrypt a chunked AES-GCM file into target, rejecting tampered or truncated input"""
+        with open(source, 'rb') as src, self._atomic_output(target) as dst:
+            header = src.read(ENCRYPTION_HEADER.size)
+            _, version, chunk_size, file_salt, base_nonce = ENCRYPTION_HEADER.unpack(header)
+            if version not in (PBKDF2_FORMAT_VERSION, ENCRYPTION_FORMAT_VERSION):
+                raise ValueError(f"Unsupported encryption format version {version}")
+            aead = self._file_cipher(self._get_pin_key(pin, version), file_salt)
+            
+            def open_sealed(index: int, sealed: bytes, is_last: bool) -> bytes:
+                return aead.decrypt(chunk_nonce(base_nonce, index), sealed, chunk_aad(header, index, is_last))
+            
+            self._transform_chunks(src, dst, chunk_size + AEAD_TAG_SIZE, open_sealed, offset=ENCRYPTION_HEADER.size)
+    
+    @contextmanager
+    def _atomic_output(self, target: Path):
+        """Write to a temporary sibling, then fsync and rename it over target; nothing is left behind on failure"""
+        tmp_path = target.with_name(target.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def _transform_chunks(self, src, dst, chunk_size: int, transform, offset: int = 0):
+        """Pipe src (from offset) to dst through transform(index, chunk, is_last) on a worker pool
+        
+        The source is memory-mapped and chunks are passed as zero-copy views.
+        At most 2 * CRYPTO_WORKERS chunks are in flight and results are
+        written back in order.
+        """
+        size = os.fstat(src.fileno()).st_size
+        if size <= offset:
+            # Nothing to map (mmap rejects empty files); an empty input is still one final chunk
+            dst.write(transform(0, b'', True))
+            return
+        
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            in_flight = deque()
+            try:
+                with ThreadPoolExecutor(max_workers=CRYPTO_WORKERS, thread_name_prefix="db-crypto") as executor:
+                    for index, start in enumerate(range(offset, size, chunk_size)):
+                        chunk = view[start:start + chunk_size]
+                        is_last = start + chunk_size >= size
+                        in_flight.append((executor.submit(transform, index, chunk, is_last), chunk))
+                        if len(in_flight) >= 2 * CRYPTO_WORKERS:
+                            self._write_chunk_result(dst, *in_flight.popleft())
+                    while in_flight:
+                        self._write_chunk_result(dst, *in_flight.popleft())
+            finally:
+                # Views must be released before the mapping can close
+                for _, chunk in in_flight:
+                    chunk.release()
+                view.release()
+    
+    @staticmethod
+    def _write_chunk_result(dst, future, chunk: memoryview):
+        """Write a finished chunk's output and release its source view"""
+        try:
+            dst.write(future.result())
+        finally:
+            chunk.release()
+    
+    def _decrypt_legacy_file(self, source: Path, target: Path, pin: str):
+        """Decrypt a whole-file Fernet token written by older versions"""
+        fernet = new_fernet(base64.urlsafe_b64encode(self._get_pin_key(pin, PBKDF2_FORMAT_VERSION)))
+        with open(source, 'rb') as f:
+            decrypted_data = fernet.decrypt(f.read())
+        with self._atomic_output(target) as f:
+            f.write(decrypted_data)
+    
+    def clear_key_cache(self):
+        """Forget all cached PIN-derived keys and ciphers"""
+        self._key_cache.clear()
+        self._cipher_cache.clear()
+    
     def _derive_key_from_pin(self, pin: str) -> bytes:
         """
         Derive encryption key from PIN using PBKDF2
@@ -180,23 +420,40 @@ class DatabaseCryptoService:
             pin: 6-digit PIN
             
         Returns:
-            32-byte encryption key
+            Raw 32-byte encryption key (base64-encode it for Fernet)
         """
         pin_bytes = pin.encode('utf-8')
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
+        # hashlib runs the whole PBKDF2 loop inside OpenSSL
+        return hashlib.pbkdf2_hmac(
+            'sha256',
+            pin_bytes,
+            self.salt,
+            100000,  # Good balance of security and performance
+            dklen=32
+        )
+    
+    def _derive_scrypt_key_from_pin(self, pin: str) -> bytes:
+        """Derive a raw 32-byte key from the PIN with memory-hard scrypt"""
+        return hashlib.scrypt(
+            pin.encode('utf-8'),
             salt=self.salt,
-            iterations=100000,  # Good balance of security and performance
+            n=SCRYPT_N,
+            r=SCRYPT_R,
+            p=SCRYPT_P,
+            dklen=32
         )
-        key = base64.urlsafe_b64encode(kdf.derive(pin_bytes))
-        return key
     
     def _create_backup(self) -> bool:
         """Create backup of current database"""
         try:
             if self.database_path.exists():
-                shutil.copy2(self.database_path, self.backup_db_path)
+                # Encryption never modifies the original in place, so a hardlink is a sufficient backup
+                self.backup_db_path.unlink(missing_ok=True)
+                try:
+                    os.link(self.database_path, self.backup_db_path)
+                except OSError:
+                    shutil.copy2(self.database_path, self.backup_db_path)
+                self._invalidate_encryption_status()
                 logger.info("Database backup created")
             return True
         except Exception as e:
@@ -207,7 +464,8 @@ class DatabaseCryptoService:
         """Restore database from backup"""
         try:
             if self.backup_db_path.exists():
-                shutil.copy2(self.backup_db_path, self.database_path)
+                os.replace(self.backup_db_path, self.database_path)
+                self._invalidate_encryption_status()
                 logger.info("Database restored from backup")
                 return True
             return False
@@ -244,6 +502,7 @@ class DatabaseCryptoService:
         try:
             if self.backup_db_path.exists():
                 os.remove(self.backup_db_path)
+                self._invalidate_encryption_status()
                 logger.info("Backup file cleaned up")
             return True
         except Exception as e:
@@ -252,15 +511,23 @@ class DatabaseCryptoService:
     
     def get_database_status(self) -> dict:
         """Get status information about database files"""
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < STATUS_CACHE_TTL_SECONDS:
+            return dict(self._status_cache[1])
+        
         try:
-            return {
-                "encrypted_exists": self.encrypted_db_path.exists(),
-                "decrypted_exists": self.database_path.exists(),
-                "backup_exists": self.backup_db_path.exists(),
+            encrypted_stat = self._stat_once(self.encrypted_db_path)
+            decrypted_stat = self._stat_once(self.database_path)
+            status = {
+                "encrypted_exists": encrypted_stat is not None,
+                "decrypted_exists": decrypted_stat is not None,
+                "backup_exists": self._stat_once(self.backup_db_path) is not None,
                 "is_encrypted": self.is_database_encrypted(),
-                "encrypted_size": self.encrypted_db_path.stat().st_size if self.encrypted_db_path.exists() else 0,
-                "decrypted_size": self.database_path.stat().st_size if self.database_path.exists() else 0
+                "encrypted_size": encrypted_stat.st_size if encrypted_stat else 0,
+                "decrypted_size": decrypted_stat.st_size if decrypted_stat else 0
             }
+            self._status_cache = (now, status)
+            return dict(status)
         except Exception as e:
             logger.error(f"Error getting database status: {e}")
             return {"error": str(e)}
\ No newline at end of file
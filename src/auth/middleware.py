@@ -1,13 +1,22 @@
 """
 Authentication middleware for Flask routes
 """
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
-from flask import request, session, jsonify, redirect, url_for
+from flask import g, request, session, jsonify, redirect, url_for
 from typing import Optional
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Tokens recently confirmed valid, so bursts of requests skip the auth service lookup
+VALID_TOKEN_TTL_SECONDS = 5.0
+VALID_TOKEN_CACHE_SIZE = 1024
+_valid_token_cache: "OrderedDict[str, float]" = OrderedDict()
+_valid_token_lock = threading.Lock()
+
 def require_authentication(f):
     """
     Decorator to require authentication for Flask routes
@@ -30,7 +39,7 @@ def require_authentication(f):
                 return _handle_unauthenticated_request()
             
             # Validate session
-            if not auth_service.is_session_valid(session_token):
+            if not _is_token_valid(auth_service, session_token):
                 logger.debug(f"Invalid session token: {session_token[:8]}...")
                 return _handle_unauthenticated_request()
             
@@ -43,34 +52,66 @@ def require_authentication(f):
     
     return decorated_function
 
+def _is_token_valid(auth_service, session_token: str) -> bool:
+    """Check a session token, trusting a recent positive answer for VALID_TOKEN_TTL_SECONDS"""
+    now = time.monotonic()
+    with _valid_token_lock:
+        expires_at = _valid_token_cache.get(session_token)
+        if expires_at is not None and expires_at > now:
+            _valid_token_cache.move_to_end(session_token)
+            return True
+    
+    is_valid = auth_service.is_session_valid(session_token)
+    with _valid_token_lock:
+        if is_valid:
+            _valid_token_cache[session_token] = now + VALID_TOKEN_TTL_SECONDS
+            _valid_token_cache.move_to_end(session_token)
+            while len(_valid_token_cache) > VALID_TOKEN_CACHE_SIZE:
+                _valid_token_cache.popitem(last=False)
+        else:
+            _valid_token_cache.pop(session_token, None)
+    return is_valid
+
+def _forget_valid_token(session_token: Optional[str]):
+    """Drop a token from the validity cache so logout takes effect immediately"""
+    if session_token:
+        with _valid_token_lock:
+            _valid_token_cache.pop(session_token, None)
+
 def _get_session_token() -> Optional[str]:
     """
-    Get session token from request headers, cookies, or session
+    Get session token for the current request, parsed once and cached on flask.g
     
     Returns:
         Session token if found, None otherwise
     """
-    # Check Authorization header
-    auth_header = request.headers.get('Authorization')
-    if auth_header and auth_header.startswith('Bearer '):
-        return auth_header[7:]  # Remove 'Bearer ' prefix
-    
-    # Check session cookie
-    if 'session_token' in session:
-        return session['session_token']
-    
-    # Check custom header
-    session_token = request.headers.get('X-Session-Token')
-    if session_token:
-        return session_token
-    
-    # Check cookie directly
-    session_token = request.cookies.get('session_token')
-    if session_token:
-        return session_token
-    
+    if 'auth_session_token' not in g:
+        g.auth_session_token = _extract_session_token()
+    return g.auth_session_token
+
+def _bearer_token(auth_header: Optional[str]) -> Optional[str]:
+    """Return the token from an 'Authorization: Bearer ...' header value"""
+    if auth_header and auth_header[:7] == 'Bearer ':
+        return auth_header[7:]
     return None
 
+# Token sources in priority order: Authorization header, session cookie, custom header, plain cookie
+_TOKEN_SOURCES = (
+    lambda: _bearer_token(request.headers.get('Authorization')),
+    lambda: session.get('session_token'),
+    lambda: request.headers.get('X-Session-Token'),
+    lambda: request.cookies.get('session_token'),
+)
+
+def _extract_session_token() -> Optional[str]:
+    """
+    Extract session token from request headers, cookies, or session
+    
+    Returns:
+        Session token if found, None otherwise
+    """
+    return next((token for source in _TOKEN_SOURCES if (token := source())), None)
+
 def _handle_unauthenticated_request():
     """
     Handle requests that are not authenticated
@@ -106,12 +147,18 @@ def clear_session():
     """
     Clear session data
     """
+    _forget_valid_token(_get_session_token())
+    
     if 'session_token' in session:
         del session['session_token']
     
+    # The token cached for this request may have come from the session just cleared
+    g.pop('auth_session_token', None)
+    
     # Also attempt to clear from auth service if available
     auth_service = getattr(require_authentication, 'auth_service', None)
     if auth_service:
         session_token = _get_session_token()
         if session_token:
+            _forget_valid_token(session_token)
             auth_service.destroy_session(session_token)
\ No newline at end of file
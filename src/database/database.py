@@ -2,18 +2,45 @@
 Database connection and session management
 """
 import os
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.engine import Engine
 from contextlib import contextmanager
 from typing import Generator
 
 from utils.config import get_config
 from utils.logging_config import get_logger
-from database.models import Base
+from database.models import Base, DataFetchLog
 
 logger = get_logger(__name__)
 
+# Built once; the health check runs on every status probe
+HEALTH_CHECK_STATEMENT = text("SELECT 1")
+
+# Per-connection SQLite tuning: WAL with NORMAL sync stays crash-safe without an fsync per commit
+SQLITE_PRAGMAS = """
+PRAGMA foreign_keys=ON;
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA busy_timeout=5000;
+"""
+
+# Bounds for the per-connection mmap window and page cache, which are sized to the database file
+SQLITE_MMAP_MIN_BYTES = 16 * 1024 * 1024
+SQLITE_MMAP_MAX_BYTES = 256 * 1024 * 1024
+SQLITE_CACHE_MIN_KIB = 2000
+SQLITE_CACHE_MAX_KIB = 64000
+
+def sqlite_size_pragmas(db_path) -> str:
+    """Build mmap_size/cache_size pragmas scaled to the database file, leaving room to grow"""
+    try:
+        file_size = os.path.getsize(db_path)
+    except OSError:
+        file_size = 0
+    mmap_size = min(max(file_size * 2, SQLITE_MMAP_MIN_BYTES), SQLITE_MMAP_MAX_BYTES)
+    cache_kib = min(max(file_size // 1024, SQLITE_CACHE_MIN_KIB), SQLITE_CACHE_MAX_KIB)
+    return f"PRAGMA mmap_size={mmap_size}; PRAGMA cache_size=-{cache_kib};"
+
 class DatabaseManager:
     """Manages database connection and sessions"""
     
@@ -36,12 +63,14 @@ class DatabaseManager:
                 pool_pre_ping=db_config["pool_pre_ping"]
             )
             
-            # Enable foreign key constraints for SQLite
-            @event.listens_for(Engine, "connect")
-            def set_sqlite_pragma(dbapi_connection, connection_record):
-                if 'sqlite' in str(dbapi_connection):
+            # Enable foreign key constraints and performance tuning for SQLite
+            if self.engine.dialect.name == "sqlite":
+                db_path = self.config["paths"]["database_path"]
+                
+                @event.listens_for(self.engine, "connect")
+                def set_sqlite_pragma(dbapi_connection, connection_record):
                     cursor = dbapi_connection.cursor()
-                    cursor.execute("PRAGMA foreign_keys=ON")
+                    cursor.executescript(SQLITE_PRAGMAS + sqlite_size_pragmas(db_path))
                     cursor.close()
             
             # Create session factory
@@ -64,11 +93,43 @@ class DatabaseManager:
         """Create all database tables"""
         try:
             Base.metadata.create_all(bind=self.engine)
+            self._migrate_fetch_log_success()
+            self._create_missing_indexes()
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Failed to create database tables: {e}")
             raise
     
+    def _migrate_fetch_log_success(self):
+        """Rebuild data_fetch_log from the old 'success'/'error' text column to a boolean"""
+        columns = {column["name"]: column for column in inspect(self.engine).get_columns("data_fetch_log")}
+        if "success" not in columns or not hasattr(columns["success"]["type"], "length"):
+            return
+        
+        # SQLite can't change a column type in place, so copy into a fresh table
+        with self.engine.begin() as connection:
+            connection.execute(text("ALTER TABLE data_fetch_log RENAME TO data_fetch_log_old"))
+            for index in DataFetchLog.__table__.indexes:
+                connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+            DataFetchLog.__table__.create(bind=connection)
+            connection.execute(text(
+                "INSERT INTO data_fetch_log "
+                "(id, series_key, fetch_timestamp, success, observations_count, error_message) "
+                "SELECT id, series_key, fetch_timestamp, success = 'success', observations_count, error_message "
+                "FROM data_fetch_log_old"
+            ))
+            connection.execute(text("DROP TABLE data_fetch_log_old"))
+        logger.info("Migrated data_fetch_log.success to a boolean column")
+    
+    def _create_missing_indexes(self):
+        """Add model indexes to tables created before those indexes existed"""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(bind=self.engine, checkfirst=True)
+                except Exception as e:
+                    logger.warning(f"Could not create index {index.name}: {e}")
+    
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """Get database session with automatic cleanup"""
@@ -89,9 +150,9 @@ class DatabaseManager:
     def health_check(self) -> bool:
         """Check database connectivity"""
         try:
-            with self.get_session() as session:
-                # Simple query to test connection
-                result = session.execute(text("SELECT 1")).fetchone()
+            # A bare pooled connection is enough; no ORM session or transaction bookkeeping needed
+            with self.engine.connect() as connection:
+                result = connection.execute(HEALTH_CHECK_STATEMENT).fetchone()
                 return result is not None
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
@@ -2,7 +2,7 @@
 SQLAlchemy database models for ECB Financial Data Visualizer
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, create_engine
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Index, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from typing import Optional
@@ -33,8 +33,8 @@ class Observation(Base):
     __tablename__ = 'observations'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    series_id = Column(Integer, ForeignKey('financial_series.id'), nullable=False, index=True)
-    period = Column(String(20), nullable=False, index=True)
+    series_id = Column(Integer, ForeignKey('financial_series.id'), nullable=False)
+    period = Column(String(20), nullable=False)
     value = Column(Float, nullable=False)
     status = Column(String(10), nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.now)
@@ -42,8 +42,9 @@ class Observation(Base):
     # Relationship to series
     series = relationship("FinancialSeries", back_populates="observations")
     
-    # Unique constraint on series_id + period
+    # Unique constraint on series_id + period; also serves "series X ordered by period" as one range scan
     __table_args__ = (
+        Index('ix_obs_series_period', 'series_id', 'period', unique=True),
         {'sqlite_autoincrement': True}
     )
     
@@ -57,9 +58,14 @@ class DataFetchLog(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     series_key = Column(String(100), nullable=False, index=True)
     fetch_timestamp = Column(DateTime, nullable=False, default=datetime.now)
-    success = Column(String(10), nullable=False)  # 'success' or 'error'
+    success = Column(Boolean, nullable=False, default=True)
     observations_count = Column(Integer, nullable=False, default=0)
     error_message = Column(String(500), nullable=True)
     
+    # Latest successful fetch lookup
+    __table_args__ = (
+        Index('ix_fetchlog_success_ts', 'success', 'fetch_timestamp'),
+    )
+    
     def __repr__(self):
         return f"<DataFetchLog(series_key={self.series_key}, success={self.success})>"
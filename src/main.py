@@ -2,10 +2,13 @@
 ECB Financial Data Visualizer - Main Streamlit Application
 """
 import streamlit as st
+import pandas as pd
 from datetime import datetime
+from typing import Optional
 import sys
 import os
-import traceback
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # Add src to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -14,11 +17,24 @@ from utils.config import get_config, STREAMLIT_CONFIG
 from utils.logging_config import get_logger
 from database.database import init_database, db_manager
 from services.data_service import DataService
-from api.ecb_client import ECBClient
+from api.ecb_client import ECBClient, get_ecb_client
+from api.data_models import InflationData, SeriesView
 
 # Setup logging
 logger = get_logger(__name__)
 
+# Page configuration, resolved once at import
+_PAGE_KW = dict(
+    page_title=STREAMLIT_CONFIG["page_title"],
+    page_icon=STREAMLIT_CONFIG["page_icon"],
+    layout=STREAMLIT_CONFIG["layout"],
+    initial_sidebar_state=STREAMLIT_CONFIG["initial_sidebar_state"]
+)
+
+# Background health checks: poll interval and how long a finished result is reused
+HEALTH_POLL_SECONDS = 1.0
+HEALTH_CHECK_TTL_SECONDS = 30
+
 # Initialize services
 @st.cache_resource
 def get_services():
@@ -32,7 +48,7 @@ def get_services():
         
         # Initialize services
         data_service = DataService()
-        ecb_client = ECBClient()
+        ecb_client = get_ecb_client()
         
         logger.info("Services initialized successfully")
         return data_service, ecb_client
@@ -42,16 +58,200 @@ def get_services():
         st.error(f"Service initialization failed: {str(e)}")
         return None, None
 
+# Cached data-service reads (the leading underscore keeps the service out of the cache key)
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_dashboard(_ds: DataService):
+    """Cached dashboard data"""
+    return _ds.get_dashboard_data()
+
+def _series_view(series) -> Optional[SeriesView]:
+    """Column view of a series, or None when it has no observations"""
+    if not series or not series.observations:
+        return None
+    return SeriesView.from_series(series)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_exchange_rates(_ds: DataService) -> Optional[SeriesView]:
+    """Cached exchange rate data"""
+    return _series_view(_ds.get_exchange_rate_data())
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_inflation(_ds: DataService) -> Optional[SeriesView]:
+    """Cached inflation data"""
+    return _series_view(_ds.get_inflation_data())
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_interest_rates(_ds: DataService) -> Optional[SeriesView]:
+    """Cached interest rate data"""
+    return _series_view(_ds.get_interest_rate_data())
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _dashboard_metrics(_ds: DataService) -> tuple:
+    """Formatted (label, value, delta) tuples for the dashboard metric tiles"""
+    dashboard_data = _cached_dashboard(_ds)
+    exchange_rates = dashboard_data.exchange_rates
+    inflation = dashboard_data.inflation
+    interest_rates = dashboard_data.interest_rates
+    
+    if exchange_rates and exchange_rates.latest_value:
+        change = exchange_rates.get_percentage_change(1)
+        fx_metric = ("EUR/USD Rate", f"{exchange_rates.latest_value:.4f}", f"{change:+.4f}%" if change else None)
+    else:
+        fx_metric = ("EUR/USD Rate", "No data", None)
+    
+    if inflation and inflation.latest_value:
+        deviation = inflation.target_deviation
+        inflation_metric = ("Inflation Rate", f"{inflation.latest_value:.1f}%",
+                            f"{deviation:+.1f}% vs target" if deviation else None)
+    else:
+        inflation_metric = ("Inflation Rate", "No data", None)
+    
+    if interest_rates and interest_rates.latest_value:
+        rate_metric = ("ECB Main Rate", f"{interest_rates.latest_value:.2f}%", None)
+    else:
+        rate_metric = ("ECB Main Rate", "No data", None)
+    
+    return fx_metric, inflation_metric, rate_metric
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_stats(_ds: DataService):
+    """Cached data statistics"""
+    return _ds.get_data_statistics()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_db_info():
+    """Cached database information"""
+    return db_manager.get_database_info()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _latest_exchange_table(_ds: DataService, limit: int = 50) -> pd.DataFrame:
+    """Most recent exchange rate observations as a table"""
+    exchange_data = _cached_exchange_rates(_ds)
+    if exchange_data is None:
+        return pd.DataFrame(columns=["Date", "Rate", "Status"])
+    
+    # The view is already period-sorted, so the newest rows are the reversed tail
+    newest = slice(None, -(limit + 1), -1)
+    return pd.DataFrame({
+        "Date": exchange_data.periods[newest],
+        "Rate": exchange_data.values[newest],
+        "Status": exchange_data.statuses[newest]
+    })
+
+@st.cache_resource
+def _background_pool() -> ThreadPoolExecutor:
+    """Shared worker pool for slow checks kept off the render path"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="ui-background")
+
+def _settings_health(ecb_client: ECBClient) -> tuple:
+    """Run the database and ECB API checks concurrently, returning (db_ok, api_ok)"""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        db_future = pool.submit(db_manager.health_check)
+        api_future = pool.submit(ecb_client.test_connection)
+        wait((db_future, api_future))
+    
+    def _ok(future):
+        return future.exception() is None and bool(future.result())
+    
+    return _ok(db_future), _ok(api_future)
+
+@st.fragment(run_every=HEALTH_POLL_SECONDS)
+def _poll_health(future):
+    """Poll a pending health check, rerunning the app once it has finished"""
+    if future.done():
+        st.rerun()
+    st.info("⏳ Checking database and ECB API...")
+
+def _show_health(ecb_client: ECBClient):
+    """Show database and ECB API status from a background health check"""
+    # The session-state timestamp is the only result cache; a finished check is reused for the TTL
+    submitted_at, future = st.session_state.get("health_check", (0.0, None))
+    if future is None or (future.done() and time.monotonic() - submitted_at > HEALTH_CHECK_TTL_SECONDS):
+        future = _background_pool().submit(_settings_health, ecb_client)
+        st.session_state["health_check"] = (time.monotonic(), future)
+    
+    # Only a pending check is polled; a finished one renders once with no timer left running
+    if not future.done():
+        _poll_health(future)
+        return
+    
+    db_health, api_health = future.result() if future.exception() is None else (False, False)
+    if db_health:
+        st.success("✅ Database: Healthy")
+    else:
+        st.error("❌ Database: Connection issues")
+    
+    if api_health:
+        st.success("✅ ECB API: Connected")
+    else:
+        st.error("❌ ECB API: Connection issues")
+
+@st.cache_resource
+def _enhanced_page_classes() -> dict:
+    """Import the enhanced page classes once; empty when the module is unavailable"""
+    try:
+        from ui.pages.enhanced_pages import (
+            EnhancedDashboardPage, EnhancedExchangeRatePage,
+            EnhancedInflationPage, EnhancedInterestRatePage
+        )
+    except ImportError:
+        logger.exception("Enhanced pages unavailable, using basic pages")
+        return {}
+    return {
+        'dashboard': EnhancedDashboardPage,
+        'exchange_rates': EnhancedExchangeRatePage,
+        'inflation': EnhancedInflationPage,
+        'interest_rates': EnhancedInterestRatePage
+    }
+
+@st.cache_resource
+def _get_pages(_ds: DataService) -> dict:
+    """Build the enhanced page objects once and reuse them across reruns"""
+    return {key: page_class(_ds) for key, page_class in _enhanced_page_classes().items()}
+
+def _enhanced_page(data_service: DataService, key: str):
+    """Enhanced page for key, or None if unavailable or it already failed this session"""
+    if key in st.session_state.setdefault('enhanced_failed', set()):
+        return None
+    return _get_pages(data_service).get(key)
+
+def _mark_enhanced_failed(key: str):
+    """Send later reruns of this session straight to the basic page"""
+    st.session_state.setdefault('enhanced_failed', set()).add(key)
+
+@st.fragment
+def _api_test(ecb_client: ECBClient):
+    """Sidebar API connection test; clicking it reruns only this fragment"""
+    if st.button("🔗 Test API Connection"):
+        with st.spinner("Testing API connection..."):
+            connection_ok = ecb_client.test_connection()
+            if connection_ok:
+                st.success("✅ API connection successful!")
+            else:
+                st.error("❌ API connection failed")
+
+def _clear_data_caches(series_keys=None):
+    """Drop cached data-service reads after a refresh, limited to series_keys' dataflows if given"""
+    series_caches = {
+        "EXR": (_cached_exchange_rates, _latest_exchange_table),
+        "ICP": (_cached_inflation,),
+        "FM": (_cached_interest_rates,)
+    }
+    resources = series_caches.keys() if series_keys is None else {key.partition(".")[0] for key in series_keys}
+    for resource in resources:
+        for cached in series_caches.get(resource, ()):
+            cached.clear()
+    
+    _cached_dashboard.clear()
+    _dashboard_metrics.clear()
+    _cached_stats.clear()
+    _cached_db_info.clear()
+
 def main():
     """Main application entry point"""
     
     # Configure Streamlit page
-    st.set_page_config(
-        page_title=STREAMLIT_CONFIG["page_title"],
-        page_icon=STREAMLIT_CONFIG["page_icon"],
-        layout=STREAMLIT_CONFIG["layout"],
-        initial_sidebar_state=STREAMLIT_CONFIG["initial_sidebar_state"]
-    )
+    st.set_page_config(**_PAGE_KW)
     
     # Initialize services
     data_service, ecb_client = get_services()
@@ -66,7 +266,7 @@ def main():
         
         page = st.selectbox(
             "Select Page",
-            ["Dashboard", "Exchange Rates", "Inflation", "Interest Rates", "Settings"]
+            list(_PAGES)
         )
         
         st.markdown("---")
@@ -80,28 +280,13 @@ def main():
             st.success("✅ Services initialized")
             
             # Test API connection
-            if st.button("🔗 Test API Connection"):
-                with st.spinner("Testing API connection..."):
-                    connection_ok = ecb_client.test_connection()
-                    if connection_ok:
-                        st.success("✅ API connection successful!")
-                    else:
-                        st.error("❌ API connection failed")
+            _api_test(ecb_client)
         else:
             st.error("❌ Services not available")
     
     # Main content based on selected page
     if data_service and ecb_client:
-        if page == "Dashboard":
-            show_enhanced_dashboard(data_service)
-        elif page == "Exchange Rates":
-            show_enhanced_exchange_rates(data_service)
-        elif page == "Inflation":
-            show_enhanced_inflation(data_service)
-        elif page == "Interest Rates":
-            show_enhanced_interest_rates(data_service)
-        elif page == "Settings":
-            show_settings(data_service)
+        _PAGES[page](data_service, ecb_client)
     else:
         st.error("⚠️ Application services are not available. Please check the logs.")
 
@@ -110,61 +295,12 @@ def show_dashboard(data_service: DataService):
     st.header("📊 Financial Data Dashboard")
     
     # Get dashboard data
-    dashboard_data = data_service.get_dashboard_data()
+    dashboard_data = _cached_dashboard(data_service)
     
     # Metrics row
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if dashboard_data.exchange_rates and dashboard_data.exchange_rates.latest_value:
-            latest_rate = dashboard_data.exchange_rates.latest_value
-            change = dashboard_data.exchange_rates.get_percentage_change(1)
-            delta = f"{change:+.4f}%" if change else None
-            
-            st.metric(
-                label="EUR/USD Rate",
-                value=f"{latest_rate:.4f}",
-                delta=delta
-            )
-        else:
-            st.metric(
-                label="EUR/USD Rate",
-                value="No data",
-                delta=None
-            )
-    
-    with col2:
-        if dashboard_data.inflation and dashboard_data.inflation.latest_value:
-            latest_inflation = dashboard_data.inflation.latest_value
-            deviation = dashboard_data.inflation.target_deviation
-            delta = f"{deviation:+.1f}% vs target" if deviation else None
-            
-            st.metric(
-                label="Inflation Rate",
-                value=f"{latest_inflation:.1f}%",
-                delta=delta
-            )
-        else:
-            st.metric(
-                label="Inflation Rate", 
-                value="No data",
-                delta=None
-            )
-    
-    with col3:
-        if dashboard_data.interest_rates and dashboard_data.interest_rates.latest_value:
-            latest_rate = dashboard_data.interest_rates.latest_value
-            st.metric(
-                label="ECB Main Rate",
-                value=f"{latest_rate:.2f}%",
-                delta=None
-            )
-        else:
-            st.metric(
-                label="ECB Main Rate",
-                value="No data",
-                delta=None
-            )
+    for col, (label, value, delta) in zip(st.columns(3), _dashboard_metrics(data_service)):
+        with col:
+            st.metric(label=label, value=value, delta=delta)
     
     st.markdown("---")
     
@@ -188,7 +324,7 @@ def show_dashboard(data_service: DataService):
     # Quick stats
     if dashboard_data.has_data:
         st.subheader("📈 Quick Statistics")
-        stats = data_service.get_data_statistics()
+        stats = _cached_stats(data_service)
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -199,15 +335,15 @@ def show_dashboard(data_service: DataService):
             if dashboard_data.exchange_rates:
                 st.metric("EUR/USD Observations", dashboard_data.exchange_rates.observation_count)
 
-def show_exchange_rates(data_service: DataService):
+def show_exchange_rates(data_service: DataService, ecb_client: ECBClient):
     """Show exchange rates page"""
     st.header("� EUR/USD Exchange Rates")
     
     # Get exchange rate data
-    exchange_data = data_service.get_exchange_rate_data()
+    exchange_data = _cached_exchange_rates(data_service)
     
-    if exchange_data and exchange_data.observations:
-        st.success(f"✅ Loaded {len(exchange_data.observations)} exchange rate observations")
+    if exchange_data:
+        st.success(f"✅ Loaded {exchange_data.observation_count} exchange rate observations")
         
         # Show latest rate
         latest = exchange_data.latest_value
@@ -223,41 +359,30 @@ def show_exchange_rates(data_service: DataService):
         
         # Simple data table (charts in Phase 3)
         if st.checkbox("Show raw data"):
-            import pandas as pd
-            df_data = []
-            for obs in sorted(exchange_data.observations, key=lambda x: x.period, reverse=True)[:50]:
-                df_data.append({
-                    "Date": obs.period,
-                    "Rate": obs.value,
-                    "Status": obs.status.value if obs.status else "Normal"
-                })
-            
-            df = pd.DataFrame(df_data)
-            st.dataframe(df, use_container_width=True)
+            st.dataframe(_latest_exchange_table(data_service), use_container_width=True)
     else:
         st.warning("⚠️ No exchange rate data available. Click 'Fetch Data' to load data.")
         if st.button("🔄 Fetch Exchange Rate Data"):
-            fetch_exchange_rate_data(data_service)
+            fetch_exchange_rate_data(data_service, ecb_client)
 
 def show_inflation(data_service: DataService):
     """Show inflation page"""
     st.header("� Inflation Data")
     
-    inflation_data = data_service.get_inflation_data()
+    inflation_data = _cached_inflation(data_service)
     
-    if inflation_data and inflation_data.observations:
-        st.success(f"✅ Loaded {len(inflation_data.observations)} inflation observations")
+    if inflation_data:
+        st.success(f"✅ Loaded {inflation_data.observation_count} inflation observations")
         
         latest = inflation_data.latest_value
         if latest:
             st.metric("Latest Inflation Rate", f"{latest:.1f}%")
             
-            deviation = inflation_data.target_deviation
-            if deviation is not None:
-                if abs(deviation) < 0.5:
-                    st.success(f"🎯 Close to ECB target (2.0%). Deviation: {deviation:+.1f}%")
-                else:
-                    st.warning(f"📊 Deviation from ECB target: {deviation:+.1f}%")
+            deviation = latest - InflationData.TARGET_RATE
+            if abs(deviation) < 0.5:
+                st.success(f"🎯 Close to ECB target ({InflationData.TARGET_RATE:.1f}%). Deviation: {deviation:+.1f}%")
+            else:
+                st.warning(f"📊 Deviation from ECB target: {deviation:+.1f}%")
     else:
         st.warning("⚠️ No inflation data available. Click 'Fetch Data' to load data.")
 
@@ -265,10 +390,10 @@ def show_interest_rates(data_service: DataService):
     """Show interest rates page"""
     st.header("🏦 Interest Rates")
     
-    rate_data = data_service.get_interest_rate_data()
+    rate_data = _cached_interest_rates(data_service)
     
-    if rate_data and rate_data.observations:
-        st.success(f"✅ Loaded {len(rate_data.observations)} interest rate observations")
+    if rate_data:
+        st.success(f"✅ Loaded {rate_data.observation_count} interest rate observations")
         
         latest = rate_data.latest_value
         if latest:
@@ -276,7 +401,7 @@ def show_interest_rates(data_service: DataService):
     else:
         st.warning("⚠️ No interest rate data available. Click 'Fetch Data' to load data.")
 
-def show_settings(data_service: DataService):
+def show_settings(data_service: DataService, ecb_client: ECBClient):
     """Show settings page"""
     st.header("⚙️ Settings")
     
@@ -291,24 +416,12 @@ def show_settings(data_service: DataService):
         st.success("✅ Database: Connected")
     
     with col2:
-        # Database health check
-        db_health = db_manager.health_check()
-        if db_health:
-            st.success("✅ Database: Healthy")
-        else:
-            st.error("❌ Database: Connection issues")
-        
-        # API test
-        ecb_client = ECBClient()
-        api_health = ecb_client.test_connection()
-        if api_health:
-            st.success("✅ ECB API: Connected")
-        else:
-            st.error("❌ ECB API: Connection issues")
+        # Health checks run in the background so the rest of the page renders immediately
+        _show_health(ecb_client)
     
     # Database info
     st.subheader("🗄️ Database Information")
-    db_info = db_manager.get_database_info()
+    db_info = _cached_db_info()
     
     col1, col2 = st.columns(2)
     with col1:
@@ -329,6 +442,7 @@ def fetch_data(data_service: DataService):
     """Fetch all data with progress indication"""
     with st.spinner("Fetching financial data from ECB API..."):
         try:
+            observations_before = data_service.get_data_statistics().get("total_observations", 0)
             result = data_service.refresh_all_data(force=True)
             
             if result.successful > 0:
@@ -337,30 +451,42 @@ def fetch_data(data_service: DataService):
                 
                 # Show detailed results
                 with st.expander("📊 Fetch Results"):
-                    for fetch_result in result.results:
-                        if fetch_result.success:
-                            st.success(f"✅ {fetch_result.series_key}: {fetch_result.observations_count} observations")
-                        else:
-                            st.error(f"❌ {fetch_result.series_key}: {fetch_result.error_message}")
+                    results_df = pd.DataFrame([{
+                        "series": r.series_key,
+                        "ok": r.success,
+                        "count": r.observations_count,
+                        "error": r.error_message
+                    } for r in result.results])
+                    st.dataframe(
+                        results_df.style.map(
+                            lambda ok: f"color: {'green' if ok else 'red'}", subset=["ok"]
+                        ),
+                        use_container_width=True,
+                        hide_index=True
+                    )
                 
-                # Rerun to refresh displayed data
-                st.rerun()
+                # Only rerun the page when the refresh actually added observations
+                _clear_data_caches([r.series_key for r in result.results if r.success])
+                observations_after = data_service.get_data_statistics().get("total_observations", 0)
+                if observations_after > observations_before:
+                    st.rerun()
+                st.info("ℹ️ No new observations since the last refresh")
             else:
                 st.error("❌ Failed to fetch data. Please check your internet connection and try again.")
                 
         except Exception as e:
             st.error(f"❌ Error fetching data: {str(e)}")
-            logger.error(f"Data fetch error: {e}\n{traceback.format_exc()}")
+            logger.exception("Data fetch error: %s", e)
 
-def fetch_exchange_rate_data(data_service: DataService):
+def fetch_exchange_rate_data(data_service: DataService, ecb_client: ECBClient):
     """Fetch only exchange rate data"""
     with st.spinner("Fetching EUR/USD exchange rate data..."):
         try:
-            ecb_client = ECBClient()
-            result = ecb_client.fetch_exchange_rates()
+            result = ecb_client.fetch_exchange_rates(use_cache=False)
             
             if result.success and result.data:
                 data_service._store_series_data(result.data)
+                _clear_data_caches([result.series_key])
                 st.success(f"✅ Successfully fetched {result.observations_count} exchange rate observations!")
                 st.rerun()
             else:
@@ -372,56 +498,77 @@ def fetch_exchange_rate_data(data_service: DataService):
 # Enhanced Phase 3 page functions
 def show_enhanced_dashboard(data_service: DataService):
     """Show enhanced dashboard with charts"""
-    from ui.pages.enhanced_pages import EnhancedDashboardPage
+    page = _enhanced_page(data_service, 'dashboard')
+    if page is None:
+        show_dashboard(data_service)
+        return
     
     try:
-        page = EnhancedDashboardPage(data_service)
         page.render()
     except Exception as e:
-        logger.error(f"Error rendering enhanced dashboard: {e}")
+        _mark_enhanced_failed('dashboard')
+        logger.exception("Error rendering enhanced dashboard: %s", e)
         st.error(f"❌ Error loading enhanced dashboard: {str(e)}")
         # Fallback to basic dashboard
         show_dashboard(data_service)
 
-def show_enhanced_exchange_rates(data_service: DataService):
+def show_enhanced_exchange_rates(data_service: DataService, ecb_client: ECBClient):
     """Show enhanced exchange rates page with charts"""
-    from ui.pages.enhanced_pages import EnhancedExchangeRatePage
+    page = _enhanced_page(data_service, 'exchange_rates')
+    if page is None:
+        show_exchange_rates(data_service, ecb_client)
+        return
     
     try:
-        page = EnhancedExchangeRatePage(data_service)
         page.render()
     except Exception as e:
-        logger.error(f"Error rendering enhanced exchange rates: {e}")
+        _mark_enhanced_failed('exchange_rates')
+        logger.exception("Error rendering enhanced exchange rates: %s", e)
         st.error(f"❌ Error loading enhanced charts: {str(e)}")
         # Fallback to basic page
-        show_exchange_rates(data_service)
+        show_exchange_rates(data_service, ecb_client)
 
 def show_enhanced_inflation(data_service: DataService):
     """Show enhanced inflation page with charts"""
-    from ui.pages.enhanced_pages import EnhancedInflationPage
+    page = _enhanced_page(data_service, 'inflation')
+    if page is None:
+        show_inflation(data_service)
+        return
     
     try:
-        page = EnhancedInflationPage(data_service)
         page.render()
     except Exception as e:
-        logger.error(f"Error rendering enhanced inflation: {e}")
+        _mark_enhanced_failed('inflation')
+        logger.exception("Error rendering enhanced inflation: %s", e)
         st.error(f"❌ Error loading enhanced charts: {str(e)}")
         # Fallback to basic page
         show_inflation(data_service)
 
 def show_enhanced_interest_rates(data_service: DataService):
     """Show enhanced interest rates page with charts"""
-    from ui.pages.enhanced_pages import EnhancedInterestRatePage
+    page = _enhanced_page(data_service, 'interest_rates')
+    if page is None:
+        show_interest_rates(data_service)
+        return
     
     try:
-        page = EnhancedInterestRatePage(data_service)
         page.render()
     except Exception as e:
-        logger.error(f"Error rendering enhanced interest rates: {e}")
+        _mark_enhanced_failed('interest_rates')
+        logger.exception("Error rendering enhanced interest rates: %s", e)
         st.error(f"❌ Error loading enhanced charts: {str(e)}")
         # Fallback to basic page
         show_interest_rates(data_service)
 
+# Page dispatch table, in sidebar order; each handler takes (data_service, ecb_client)
+_PAGES = {
+    "Dashboard": lambda ds, client: show_enhanced_dashboard(ds),
+    "Exchange Rates": show_enhanced_exchange_rates,
+    "Inflation": lambda ds, client: show_enhanced_inflation(ds),
+    "Interest Rates": lambda ds, client: show_enhanced_interest_rates(ds),
+    "Settings": show_settings
+}
+
 if __name__ == "__main__":
     logger.info("ECB Financial Data Visualizer started")
     main()
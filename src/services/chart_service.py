@@ -6,6 +6,7 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
+import numpy as np
 import pandas as pd
 
 from api.data_models import ExchangeRateData, InflationData, InterestRateData, DashboardData
@@ -48,9 +49,11 @@ class ChartService:
         fig = go.Figure()
         
         # Add main line chart
-        # Convert DataFrame values to native Python types to avoid JSON serialization issues
+        # Traces get plain lists: plotly>=6 base64-encodes ndarrays, which the
+        # plotly.js bundled by the templates cannot decode
         dates = df['date'].dt.strftime('%Y-%m-%d').tolist()  # Convert to ISO date strings for JSON
-        rates = df['rate'].astype(float).tolist()       # Convert to Python float list
+        rate_values = df['rate'].to_numpy(dtype=np.float64)
+        rates = rate_values.tolist()       # Single C-level conversion to a float list
         
         fig.add_trace(go.Scatter(
             x=dates,
@@ -94,6 +97,9 @@ class ChartService:
         
         # Config is for display in Streamlit, not layout
         
+        # Keep the raw values so callers can compute statistics without walking the trace
+        fig._y_array = rate_values
+        
         return fig
     
     def create_inflation_chart(self, data: InflationData) -> go.Figure:
@@ -110,9 +116,11 @@ class ChartService:
         fig = go.Figure()
         
         # Add inflation line
-        # Convert DataFrame values to native Python types to avoid JSON serialization issues
+        # Traces get plain lists: plotly>=6 base64-encodes ndarrays, which the
+        # plotly.js bundled by the templates cannot decode
         dates = df['date'].dt.strftime('%Y-%m-%d').tolist()  # Convert to ISO date strings for JSON
-        rates = df['rate'].astype(float).tolist()       # Convert to Python float list
+        rate_values = df['rate'].to_numpy(dtype=np.float64)
+        rates = rate_values.tolist()       # Single C-level conversion to a float list
         
         fig.add_trace(go.Scatter(
             x=dates,
@@ -167,6 +175,9 @@ class ChartService:
         
         # Config is for display in Streamlit, not layout
         
+        # Keep the raw values so callers can compute statistics without walking the trace
+        fig._y_array = rate_values
+        
         return fig
     
     def create_interest_rate_chart(self, data: InterestRateData) -> go.Figure:
@@ -185,9 +196,11 @@ class ChartService:
         # Add interest rate line (step chart for policy rates)
         series_name = data.metadata.title.split(' - ')[0] if data.metadata and data.metadata.title else 'ECB Rate'
         
-        # Convert DataFrame values to native Python types to avoid JSON serialization issues
+        # Traces get plain lists: plotly>=6 base64-encodes ndarrays, which the
+        # plotly.js bundled by the templates cannot decode
         dates = df['date'].dt.strftime('%Y-%m-%d').tolist()  # Convert to ISO date strings for JSON
-        rates = df['rate'].astype(float).tolist()       # Convert to Python float list
+        rate_values = df['rate'].to_numpy(dtype=np.float64)
+        rates = rate_values.tolist()       # Single C-level conversion to a float list
         
         fig.add_trace(go.Scatter(
             x=dates,
@@ -232,6 +245,9 @@ class ChartService:
         
         # Config is for display in Streamlit, not layout
         
+        # Keep the raw values so callers can compute statistics without walking the trace
+        fig._y_array = rate_values
+        
         return fig
     
     def create_dashboard_overview(self, dashboard_data: DashboardData) -> go.Figure:
@@ -323,51 +339,17 @@ class ChartService:
     
     def _prepare_exchange_rate_data(self, data: ExchangeRateData) -> pd.DataFrame:
         """Convert exchange rate data to DataFrame for plotting"""
-        records = []
-        for obs in sorted(data.observations, key=lambda x: x.period):
-            try:
-                date = pd.to_datetime(obs.period)
-                records.append({
-                    'date': date,
-                    'rate': obs.value
-                })
-            except Exception as e:
-                logger.warning(f"Skipping invalid observation: {obs.period} - {e}")
-        
-        return pd.DataFrame(records)
+        return self._observations_to_frame(data.observations)
     
     def _prepare_inflation_data(self, data: InflationData) -> pd.DataFrame:
         """Convert inflation data to DataFrame for plotting"""
-        records = []
-        for obs in sorted(data.observations, key=lambda x: x.period):
-            try:
-                date = pd.to_datetime(obs.period)
-                records.append({
-                    'date': date,
-                    'rate': obs.value
-                })
-            except Exception as e:
-                logger.warning(f"Skipping invalid observation: {obs.period} - {e}")
-        
-        return pd.DataFrame(records)
+        return self._observations_to_frame(data.observations)
     
     def _prepare_interest_rate_data(self, data: InterestRateData) -> pd.DataFrame:
         """Convert interest rate data to DataFrame for plotting"""
-        records = []
-        
         logger.info(f"Preparing chart data from {len(data.observations)} observations")
         
-        for obs in sorted(data.observations, key=lambda x: x.period):
-            try:
-                date = pd.to_datetime(obs.period)
-                records.append({
-                    'date': date,
-                    'rate': obs.value
-                })
-            except Exception as e:
-                logger.warning(f"Skipping invalid observation: {obs.period} - {e}")
-        
-        df = pd.DataFrame(records)
+        df = self._observations_to_frame(data.observations)
         logger.info(f"Chart DataFrame created with {len(df)} rows")
         if len(df) > 0:
             logger.info(f"Sample values: {df['rate'].head().tolist()}")
@@ -375,6 +357,24 @@ class ChartService:
         
         return df
     
+    def _observations_to_frame(self, observations) -> pd.DataFrame:
+        """Build a date-sorted DataFrame from observations with vectorized parsing"""
+        count = len(observations)
+        dates = pd.to_datetime([obs.period for obs in observations], errors='coerce')
+        rates = np.fromiter(
+            (np.nan if obs.value is None else obs.value for obs in observations),
+            dtype=np.float64,
+            count=count
+        )
+        
+        df = pd.DataFrame({'date': dates, 'rate': rates})
+        invalid = df['date'].isna()
+        if invalid.any():
+            logger.warning(f"Skipping {int(invalid.sum())} invalid observations")
+            df = df[~invalid]
+        
+        return df.sort_values('date', kind='stable').reset_index(drop=True)
+    
     def _create_empty_chart(self, message: str) -> go.Figure:
         """Create an empty chart with a message"""
         fig = go.Figure()
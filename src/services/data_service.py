@@ -1,12 +1,13 @@
 """
 Data service for orchestrating data fetching, caching, and storage
 """
+import time
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
-from api.ecb_client import ECBClient
+from api.ecb_client import get_ecb_client
 from api.data_models import (
     ECBSeriesData, ExchangeRateData, InflationData, InterestRateData,
     DataFetchResult, RefreshResult, DashboardData
@@ -24,29 +25,33 @@ class DataService:
     
     def __init__(self):
         self.config = get_config()
-        self.ecb_client = ECBClient()
+        self.ecb_client = get_ecb_client()
     
     def refresh_all_data(self, force: bool = False) -> RefreshResult:
         """Refresh all financial data series"""
+        # Read the wall clock once; the end time is derived from the monotonic clock
         start_time = datetime.now()
+        start_monotonic = time.monotonic()
         results = []
         
         # Define series to refresh
-        series_to_fetch = [
-            ("EUR_USD_DAILY", self.ecb_client.fetch_exchange_rates),
-            ("INFLATION_MONTHLY", self.ecb_client.fetch_inflation_data),
-            ("ECB_MAIN_RATE", self.ecb_client.fetch_interest_rates)
-        ]
+        series_to_fetch = ["EUR_USD_DAILY", "INFLATION_MONTHLY", "ECB_MAIN_RATE"]
+        
+        # Check which series need refreshing
+        pending = []
+        for series_name in series_to_fetch:
+            if not force and not self._should_refresh_series(series_name):
+                logger.info(f"Skipping {series_name} - recently updated")
+                continue
+            pending.append(series_name)
         
-        for series_name, fetch_func in series_to_fetch:
+        # Fetch concurrently; storage below stays sequential on this thread.
+        # A forced refresh bypasses the client's response cache
+        fetched = self.ecb_client.fetch_all(pending, use_cache=not force)
+        
+        for series_name in pending:
             try:
-                # Check if we need to refresh this series
-                if not force and not self._should_refresh_series(series_name):
-                    logger.info(f"Skipping {series_name} - recently updated")
-                    continue
-                
-                # Fetch data
-                result = fetch_func()
+                result = fetched[series_name]
                 results.append(result)
                 
                 # Store in database if successful
@@ -62,7 +67,7 @@ class DataService:
                     error_message=str(e)
                 ))
         
-        end_time = datetime.now()
+        end_time = start_time + timedelta(seconds=time.monotonic() - start_monotonic)
         
         # Calculate summary
         successful = sum(1 for r in results if r.success)
@@ -256,7 +261,7 @@ class DataService:
                 log_entry = DataFetchLog(
                     series_key=result.series_key,
                     fetch_timestamp=result.fetch_timestamp,
-                    success="success" if result.success else "error",
+                    success=result.success,
                     observations_count=result.observations_count,
                     error_message=result.error_message
                 )
@@ -271,7 +276,7 @@ class DataService:
         try:
             with get_db_session() as session:
                 last_log = session.query(DataFetchLog).filter(
-                    DataFetchLog.success == "success"
+                    DataFetchLog.success.is_(True)
                 ).order_by(desc(DataFetchLog.fetch_timestamp)).first()
                 
                 return last_log.fetch_timestamp if last_log else None
@@ -294,7 +299,7 @@ class DataService:
         )
         
         obs_list = [
-            ECBObservation(
+            ECBObservation.from_trusted(
                 period=obs.period,
                 value=obs.value,
                 status=ObservationStatus(obs.status) if obs.status else ObservationStatus.NORMAL
@@ -302,7 +307,7 @@ class DataService:
             for obs in observations
         ]
         
-        return ExchangeRateData(metadata=metadata, observations=obs_list)
+        return ExchangeRateData.from_trusted(metadata, obs_list)
     
     def _db_to_inflation_data(self, series: FinancialSeries, observations: List[Observation]) -> InflationData:
         """Convert database objects to InflationData"""
@@ -318,7 +323,7 @@ class DataService:
         )
         
         obs_list = [
-            ECBObservation(
+            ECBObservation.from_trusted(
                 period=obs.period,
                 value=obs.value,
                 status=ObservationStatus(obs.status) if obs.status else ObservationStatus.NORMAL
@@ -326,7 +331,7 @@ class DataService:
             for obs in observations
         ]
         
-        return InflationData(metadata=metadata, observations=obs_list)
+        return InflationData.from_trusted(metadata, obs_list)
     
     def _db_to_interest_rate_data(self, series: FinancialSeries, observations: List[Observation]) -> InterestRateData:
         """Convert database objects to InterestRateData"""
@@ -342,7 +347,7 @@ class DataService:
         )
         
         obs_list = [
-            ECBObservation(
+            ECBObservation.from_trusted(
                 period=obs.period,
                 value=obs.value,
                 status=ObservationStatus(obs.status) if obs.status else ObservationStatus.NORMAL
@@ -350,7 +355,7 @@ class DataService:
             for obs in observations
         ]
         
-        return InterestRateData(metadata=metadata, observations=obs_list)
+        return InterestRateData.from_trusted(metadata, obs_list)
     
     def get_data_statistics(self) -> Dict[str, Any]:
         """Get statistics about stored data"""
@@ -74,7 +74,7 @@ class EnhancedExchangeRatePage:
         """Fetch exchange rate data"""
         with st.spinner("Fetching EUR/USD exchange rate data..."):
             try:
-                result = self.data_service.ecb_client.fetch_exchange_rates()
+                result = self.data_service.ecb_client.fetch_exchange_rates(use_cache=False)
                 if result.success:
                     st.success("✅ Exchange rate data fetched successfully!")
                     st.rerun()
@@ -181,7 +181,7 @@ class EnhancedInflationPage:
         """Fetch inflation data"""
         with st.spinner("Fetching inflation data..."):
             try:
-                result = self.data_service.ecb_client.fetch_inflation_data()
+                result = self.data_service.ecb_client.fetch_inflation_data(use_cache=False)
                 if result.success:
                     st.success("✅ Inflation data fetched successfully!")
                     st.rerun()
@@ -314,7 +314,7 @@ class EnhancedInterestRatePage:
         """Fetch interest rate data"""
         with st.spinner("Fetching interest rate data..."):
             try:
-                result = self.data_service.ecb_client.fetch_interest_rates()
+                result = self.data_service.ecb_client.fetch_interest_rates(use_cache=False)
                 if result.success:
                     st.success("✅ Interest rate data fetched successfully!")
                     st.rerun()
@@ -2,6 +2,7 @@
 Configuration management for ECB Financial Data Visualizer
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -18,6 +19,8 @@ ECB_API_CONFIG = {
     "max_retries": 3,
     "retry_delay": 1,  # seconds
     "rate_limit_per_minute": 10,
+    "cache_ttl_seconds": 3600,  # Reuse API responses on disk for this long (0 disables)
+    "strict_parse": False,  # Validate whole responses with the ECBAPIResponse model (debugging aid)
     "use_local_data": False,  # Switch to use local raw-data files instead of API
     "local_data_dir": "data/raw-data"  # Directory containing downloaded XML files
 }
@@ -94,7 +97,7 @@ RANGE_SELECTOR_BUTTONS = [
 DATABASE_CONFIG = {
     "sqlite_url": f"sqlite:///{DATABASE_PATH}",
     "echo": False,  # Set to True for SQL debugging
-    "pool_pre_ping": True
+    "pool_pre_ping": False  # A local SQLite file can't drop connections, so skip the per-checkout ping
 }
 
 # Security Configuration
@@ -112,8 +115,9 @@ def ensure_directories():
     DATA_DIR.mkdir(exist_ok=True)
     CACHE_DIR.mkdir(exist_ok=True)
 
+@lru_cache(maxsize=1)
 def get_config() -> Dict[str, Any]:
-    """Get complete configuration dictionary"""
+    """Get complete configuration dictionary (built once per process)"""
     ensure_directories()
     return {
         "paths": {
@@ -2,6 +2,8 @@
 Utility helper functions
 """
 import json
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 from pathlib import Path
@@ -49,7 +51,7 @@ def get_default_date_range() -> tuple[str, str]:
 def save_json_cache(data: Dict[str, Any], filename: str, cache_dir: Path) -> bool:
     """Save data to JSON cache file"""
     try:
-        cache_dir.mkdir(exist_ok=True)
+        cache_dir.mkdir(parents=True, exist_ok=True)
         cache_file = cache_dir / f"{filename}.json"
         
         with open(cache_file, 'w') as f:
@@ -86,3 +88,32 @@ def validate_date_range(start_date: str, end_date: str) -> bool:
         return start <= end
     except ValueError:
         return False
+
+class TokenBucket:
+    """Thread-safe token bucket: bursts of up to rate_per_minute calls, then throttles to that rate"""
+    
+    def __init__(self, rate_per_minute: float):
+        self._capacity = float(rate_per_minute)
+        self._refill_per_second = self._capacity / 60
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; returns the seconds slept"""
+        # Serialized so concurrent callers draw from the same bucket
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity,
+                               self._tokens + (now - self._last_refill) * self._refill_per_second)
+            self._last_refill = now
+            
+            sleep_time = 0.0
+            if self._tokens < 1:
+                sleep_time = (1 - self._tokens) / self._refill_per_second
+                time.sleep(sleep_time)
+                self._tokens = 1.0
+                self._last_refill = time.monotonic()
+            
+            self._tokens -= 1
+            return sleep_time